@@ -1,7 +1,7 @@
 import os
 from abc import ABC, abstractmethod
 from pydantic import BaseModel
-from typing import Any, Optional, Dict, List, Tuple
+from typing import Any, Optional, Dict, List, Tuple, Union
 
 
 # Interface for the vector database
@@ -95,8 +95,10 @@ class LLMService(ABC):
         self.retries = session_retries or 3
 
     @abstractmethod
-    def generate_embeddings(self, input: List[str]) -> Optional[List[float]]:
-        """Generates an embedding for the given list of text."""
+    def generate_embeddings(
+        self, input: Union[str, List[str]]
+    ) -> Optional[Union[List[float], List[List[float]]]]:
+        """Generates an embedding for the given text, or one embedding per text for a list."""
         pass
 
     @abstractmethod
@@ -2,6 +2,7 @@
 import json
 import os
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Tuple, Optional
 
 # Third-party imports
@@ -14,6 +15,12 @@ from fbpyutils_ai import logging
 from fbpyutils_ai.tools import LLMService, VectorDatabase
 
 
+# Maximum number of documents embedded per request by EmbeddingManager.add_documents
+EMBEDDING_BATCH_SIZE = 64
+# Maximum number of batches embedded concurrently when add_documents runs in parallel
+EMBEDDING_MAX_WORKERS = 4
+
+
 # Implementation for ChromaDB
 class ChromaDB(VectorDatabase):
     def __init__(
@@ -579,7 +586,7 @@ class EmbeddingManager:
             meta (Optional[Dict[str, Any]], optional): The metadata for the document. Defaults to None.
         """
         document_id = id if id is not None else self.generate_id_from_text(text)
-        embedding = self.llm_service.generate_embedding(text)
+        embedding = self.llm_service.generate_embeddings(text)
         if embedding:
             self.vector_database.add_embeddings(
                 [document_id], [embedding], [meta or {}]
@@ -589,6 +596,7 @@ class EmbeddingManager:
         self,
         documents: List[Tuple[str, str, Optional[Dict[str, Any]]]],
         parallel: bool = True,
+        batch_size: int = EMBEDDING_BATCH_SIZE,
     ):
         """
         Adds multiple documents to the database.
@@ -598,39 +606,73 @@ class EmbeddingManager:
                 - text: The text of the document.
                 - id: Optional id of the document. If None, it will be generated from the text.
                 - meta: Optional metadata for the document.
-            parallel (bool, optional): Whether to process the documents in parallel. Defaults to True.
+            parallel (bool, optional): Whether to request the embeddings of the batches concurrently. Defaults to True.
+            batch_size (int, optional): Maximum number of documents embedded per request. Defaults to EMBEDDING_BATCH_SIZE.
         """
-        params = [(text, id, meta) for text, id, meta in documents]
-        processor = Process(process=self._process_document, parallelize=parallel)
-        results = processor.run(params=params)
+        if batch_size <= 0:
+            raise ValueError("batch_size must be greater than 0")
+        if not documents:
+            return
 
-        ids = [result[0] for result in results if result]
-        embeddings = [result[1] for result in results if result]
-        metadatas = [result[2] for result in results if result]
+        batches = [
+            documents[start : start + batch_size]
+            for start in range(0, len(documents), batch_size)
+        ]
+        if parallel and len(batches) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(len(batches), EMBEDDING_MAX_WORKERS)
+            ) as executor:
+                results = list(executor.map(self._process_batch, batches))
+        else:
+            results = [self._process_batch(batch) for batch in batches]
 
-        if ids and embeddings and metadatas:
-            self.vector_database.add_embeddings(ids, embeddings, metadatas)
+        ids, vectors, metadatas = [], [], []
+        for result in results:
+            for document_id, embedding, meta in result:
+                ids.append(document_id)
+                vectors.append(embedding)
+                metadatas.append(meta)
 
-    def _process_document(
-        self, text: str, id: str = None, meta: Optional[Dict[str, Any]] = None
-    ) -> Optional[Tuple[str, List[float], Dict[str, Any]]]:
+        if ids:
+            self.vector_database.add_embeddings(ids, vectors, metadatas)
+
+    def _process_batch(
+        self, documents: List[Tuple[str, str, Optional[Dict[str, Any]]]]
+    ) -> List[Tuple[str, List[float], Dict[str, Any]]]:
         """
-        Processes a single document, generating embedding and preparing data for database insertion.
+        Embeds a batch of documents with a single request and prepares them for database insertion.
 
         Args:
-            text (str): The text of the document.
-            id (str, optional): The ID of the document. If None, it will be generated from the text. Defaults to None.
-            meta (Optional[Dict[str, Any]], optional): The metadata for the document. Defaults to None.
+            documents (List[Tuple[str, str, Optional[Dict[str, Any]]]]): The (text, id, meta) tuples of the batch.
 
         Returns:
-            Optional[Tuple[str, List[float], Dict[str, Any]]]: A tuple containing the document ID, embedding, and metadata, or None if the embedding could not be generated.
+            List[Tuple[str, List[float], Dict[str, Any]]]: A tuple containing the document ID, embedding, and metadata
+                for each document whose embedding could be generated.
         """
-        document_id = id if id is not None else self.generate_id_from_text(text)
-        embedding = self.llm_service.generate_embedding(text)
-        if embedding:
-            return document_id, embedding, meta or {}
-        else:
-            return None
+        embeddings = self.llm_service.generate_embeddings(
+            [text for text, _, _ in documents]
+        )
+        if not embeddings:
+            logging.error(
+                f"Embeddings could not be generated for a batch of {len(documents)} documents; batch skipped."
+            )
+            return []
+        if len(embeddings) != len(documents):
+            logging.error(
+                f"Expected {len(documents)} embeddings for a batch but got {len(embeddings)}; batch skipped."
+            )
+            return []
+
+        results = []
+        for (text, id, meta), embedding in zip(documents, embeddings):
+            document_id = id if id is not None else self.generate_id_from_text(text)
+            if embedding:
+                results.append((document_id, embedding, meta or {}))
+            else:
+                logging.warning(
+                    f"Embedding could not be generated for document {document_id}; document skipped."
+                )
+        return results
 
     def generate_id_from_text(self, text: str) -> str:
         """
@@ -658,7 +700,7 @@ class EmbeddingManager:
         Returns:
             List[Tuple[str, float]]: A list of tuples containing the ID and distance of the similar documents.
         """
-        embedding = self.llm_service.generate_embedding(text)
+        embedding = self.llm_service.generate_embeddings(text)
         if embedding:
             return self.vector_database.search_embeddings(
                 embedding, n_results, similarity_by
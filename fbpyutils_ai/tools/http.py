@@ -1,15 +1,24 @@
+import asyncio
 import json
 import httpx
 import logging
 import requests
 import random
+import threading
+from collections import OrderedDict
+from functools import partial
 from time import perf_counter
 from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Any, Optional, Dict, Union, Generator, List, Tuple, AsyncGenerator
-import tenacity # Import tenacity
-from tenacity import retry, wait_random_exponential, stop_after_attempt
+import tenacity
 
 
+# Default tenacity retry policy shared by HTTPClient and RequestsManager; the policy
+# objects are stateless, so one instance serves every call that does not override them
+DEFAULT_RETRY_WAIT = tenacity.wait_random_exponential(multiplier=1, max=40)
+DEFAULT_RETRY_STOP = tenacity.stop_after_attempt(3)
+
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/109.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/109.0.0.0 Safari/537.36",
@@ -57,6 +66,12 @@ class HTTPClient:
         >>> asyncio.run(main())
     """
 
+    # Connection pool limits for the asynchronous client; idle keep-alive connections
+    # are dropped after 15 seconds
+    _ASYNC_LIMITS = httpx.Limits(
+        max_connections=100, max_keepalive_connections=20, keepalive_expiry=15.0
+    )
+
     def __init__(
         self, base_url: str, headers: Optional[Dict] = None, verify_ssl: bool = True
     ):
@@ -79,10 +94,13 @@ class HTTPClient:
 
         # Configura clientes com timeout padrão e reutilização de conexão
         self._sync_client = httpx.Client(
-            headers=self.headers, timeout=httpx.Timeout(10.0)
+            headers=self.headers, timeout=httpx.Timeout(10.0), verify=self.verify_ssl
         )
         self._async_client = httpx.AsyncClient(
-            headers=self.headers, timeout=httpx.Timeout(10.0)
+            headers=self.headers,
+            timeout=httpx.Timeout(10.0),
+            verify=self.verify_ssl,
+            limits=HTTPClient._ASYNC_LIMITS,
         )
         logging.info(f"HTTPClient initialized for {self.base_url}")
 
@@ -95,8 +113,8 @@ class HTTPClient:
         data: Optional[Dict] = None,
         json: Optional[Dict] = None,
         stream: bool = False,
-        wait: Any = wait_random_exponential(multiplier=1, max=40), # Pass retry parameters
-        stop: Any = stop_after_attempt(3), # Pass retry parameters
+        wait: Any = DEFAULT_RETRY_WAIT, # Pass retry parameters
+        stop: Any = DEFAULT_RETRY_STOP, # Pass retry parameters
     ) -> httpx.Response:
         """Executes an asynchronous HTTP request.
 
@@ -136,7 +154,8 @@ class HTTPClient:
             elif method_upper == "PUT":
                 response = await self._async_client.put(url, params=params, data=data, json=json) # Não passar stream aqui diretamente
             elif method_upper == "DELETE":
-                response = await self._async_client.delete(url, params=params, data=data, json=json) # Não passar stream aqui diretamente
+                # AsyncClient.delete() takes no body; request() keeps data/json for DELETE
+                response = await self._async_client.request("DELETE", url, params=params, data=data, json=json)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
 
@@ -183,8 +202,8 @@ class HTTPClient:
         data: Optional[Dict] = None,
         json: Optional[Dict] = None,
         stream: bool = False,
-        wait: Any = wait_random_exponential(multiplier=1, max=40), # Pass retry parameters
-        stop: Any = stop_after_attempt(3), # Pass retry parameters
+        wait: Any = DEFAULT_RETRY_WAIT, # Pass retry parameters
+        stop: Any = DEFAULT_RETRY_STOP, # Pass retry parameters
     ) -> httpx.Response:
         """Executes a synchronous HTTP request.
 
@@ -276,16 +295,50 @@ class RequestsManager:
     - JSON response parsing
     - Comprehensive error handling and logging
     - Centralized HTTP session management
+    - Asynchronous requests (amake_request) over a pooled httpx.AsyncClient per event loop
 
     The class is primarily designed for interacting with LLM APIs like OpenAI but can be
     used for any service that requires HTTP requests with JSON responses.
     """
 
+    # Sessions shared by create_session() and request(), keyed by (max_retries, auth, bearer_token, verify_ssl)
+    # and kept in least-recently-used order; the oldest session is closed once the cache is full
+    _SESSION_CACHE_MAXSIZE = 32
+    _session_cache: "OrderedDict[Tuple[Any, ...], requests.Session]" = OrderedDict()
+    _session_cache_lock = threading.Lock()
+
+    _ALLOWED_METHODS = frozenset(["GET", "POST", "PUT", "DELETE"])
+    # Session method and payload keyword per HTTP method: GET sends json_data as query params
+    _METHOD_DISPATCH = {
+        "GET": ("get", "params"),
+        "POST": ("post", "json"),
+        "PUT": ("put", "json"),
+        "DELETE": ("delete", "json"),
+    }
+
+    # Adapter-level retries for throttling and gateway status codes; make_request()'s tenacity
+    # loop retries every other failure, so each failure is retried by exactly one layer
+    _RETRY_STATUS_FORCELIST = (429, 502, 503, 504)
+    _RETRY_ALLOWED_METHODS = frozenset(["GET", "POST"])
+
+    # AsyncClients used by amake_request(), one per event loop and created lazily on first use;
+    # an AsyncClient's connections belong to the loop that opened them, so clients are never shared
+    # across loops. Each entry also holds the async generator that closes and removes it when the
+    # loop shuts down its async generators (asyncio.run() does), or when aclose() is called
+    _async_clients: Dict[
+        asyncio.AbstractEventLoop, Tuple[httpx.AsyncClient, AsyncGenerator[None, None]]
+    ] = {}
+    _async_clients_lock = threading.Lock()
+    _ASYNC_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
     @staticmethod
     def create_session(max_retries: int = 2, auth: Optional[Tuple[str, str]] = None,
                       bearer_token: Optional[str] = None, verify_ssl: Union[bool, str] = True) -> requests.Session:
         """
-        Creates and configures a requests Session with retry capabilities.
+        Returns a configured requests Session with retry capabilities.
+
+        Sessions are shared per (max_retries, auth, bearer_token, verify_ssl), so callers must
+        not mutate the returned session; pass per-request headers to make_request instead.
 
         Args:
             max_retries: Maximum number of retries for the session adapter
@@ -294,10 +347,39 @@ class RequestsManager:
             verify_ssl: Verify SSL certificate (True/False or path to CA bundle)
 
         Returns:
-            A configured requests.Session object
+            A configured requests.Session object shared by all callers with the same configuration
+        """
+        return RequestsManager._get_or_create_session(
+            max_retries=max_retries,
+            auth=auth,
+            bearer_token=bearer_token,
+            verify_ssl=verify_ssl
+        )
+
+    @staticmethod
+    def _build_session(max_retries: int = 2, auth: Optional[Tuple[str, str]] = None,
+                       bearer_token: Optional[str] = None,
+                       verify_ssl: Union[bool, str] = True) -> requests.Session:
+        """Builds a new, uncached requests Session with retry capabilities.
+
+        429/502/503/504 responses are retried inside the adapter's connection pool, with
+        exponential backoff honouring Retry-After. Connection and read errors are left to
+        the tenacity loop in make_request(), which skips the statuses retried here.
         """
         session = requests.Session()
-        adapter = HTTPAdapter(max_retries=max_retries)
+        retry = Retry(
+            total=max_retries,
+            connect=0,
+            read=0,
+            other=0,
+            status=max_retries,
+            backoff_factor=0.5,
+            status_forcelist=RequestsManager._RETRY_STATUS_FORCELIST,
+            allowed_methods=RequestsManager._RETRY_ALLOWED_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False,  # Return the last response so raise_for_status reports it
+        )
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=100, max_retries=retry)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
@@ -309,16 +391,55 @@ class RequestsManager:
         session.verify = verify_ssl
         return session
 
+    @staticmethod
+    def _get_or_create_session(max_retries: int = 2, auth: Optional[Tuple[str, str]] = None,
+                               bearer_token: Optional[str] = None,
+                               verify_ssl: Union[bool, str] = True) -> requests.Session:
+        """
+        Returns the cached session for the given configuration, creating it on first use.
+
+        Reusing the session keeps its connection pool warm, so successive requests with the
+        same credentials skip the TCP and TLS handshakes.
+
+        Args:
+            max_retries: Maximum number of retries for the session adapter
+            auth: Tuple of (username, password) for basic authentication
+            bearer_token: Bearer token for authentication
+            verify_ssl: Verify SSL certificate (True/False or path to CA bundle)
+
+        Returns:
+            A configured requests.Session object shared by all callers with the same configuration
+        """
+        key = (max_retries, auth, bearer_token, verify_ssl)
+        with RequestsManager._session_cache_lock:
+            session = RequestsManager._session_cache.get(key)
+            if session is not None:
+                RequestsManager._session_cache.move_to_end(key)
+                return session
+            session = RequestsManager._build_session(
+                max_retries=max_retries,
+                auth=auth,
+                bearer_token=bearer_token,
+                verify_ssl=verify_ssl
+            )
+            RequestsManager._session_cache[key] = session
+            while len(RequestsManager._session_cache) > RequestsManager._SESSION_CACHE_MAXSIZE:
+                _, evicted = RequestsManager._session_cache.popitem(last=False)
+                evicted.close()
+        return session
+
     @staticmethod
     def request(url: str, headers: Dict[str, str], json_data: Dict[str, Any],
                 timeout: Union[int, Tuple[int, int]] = (30, 30), method: str = "GET",
                 stream: bool = False, max_retries: int = 2, auth: Optional[Tuple[str, str]] = None,
                 bearer_token: Optional[str] = None, verify_ssl: Union[bool, str] = True,
-                wait: Any = wait_random_exponential(multiplier=1, max=40), # Add wait parameter
-                stop: Any = stop_after_attempt(3) # Add stop parameter
+                wait: Any = DEFAULT_RETRY_WAIT, # Add wait parameter
+                stop: Any = DEFAULT_RETRY_STOP # Add stop parameter
                ) -> requests.Response:
         """
-        Convenience method that creates a session and makes a request in one call.
+        Convenience method that gets a pooled session and makes a request in one call.
+
+        Calls with the same retry, authentication and SSL settings share one session.
 
         Args:
             url: The URL to make the request to
@@ -338,7 +459,7 @@ class RequestsManager:
                                response.text, or iterating over response.iter_lines() or
                                response.iter_content()).
         """
-        session = RequestsManager.create_session(
+        session = RequestsManager._get_or_create_session(
             max_retries=max_retries,
             auth=auth,
             bearer_token=bearer_token,
@@ -361,8 +482,8 @@ class RequestsManager:
     def make_request(session: requests.Session, url: str, headers: Dict[str, str],
                     json_data: Dict[str, Any], timeout: Union[int, Tuple[int, int]],
                     method: str = "GET", stream: bool = False,
-                    wait: Any = wait_random_exponential(multiplier=1, max=40), # Add wait parameter
-                    stop: Any = stop_after_attempt(3) # Add stop parameter
+                    wait: Any = DEFAULT_RETRY_WAIT, # Add wait parameter
+                    stop: Any = DEFAULT_RETRY_STOP # Add stop parameter
                    ) -> requests.Response:
         """
         Makes an HTTP request to the specified URL with the given parameters.
@@ -387,17 +508,10 @@ class RequestsManager:
             requests.exceptions.RequestException: For other request-related errors
             ValueError: If an unsupported HTTP method is specified
         """
-        # Validate HTTP method
-        method = method.upper()
-        if method not in ["GET", "POST", "PUT", "DELETE"]:
-            raise ValueError(f"Unsupported HTTP method: {method}. Supported methods are GET, POST, PUT and DELETE.")
-
-        if stream and method != "POST":
-            raise ValueError("Streaming is only supported for POST requests in RequestsManager.")
+        method = RequestsManager._validate_method(method, stream)
 
         # Convert timeout to tuple if necessary
-        if isinstance(timeout, int):
-            timeout = (timeout, timeout)
+        timeout = RequestsManager._normalize_timeout(timeout)
 
         # Call the internal method that handles execution and retries
         return RequestsManager._execute_request_with_retry(
@@ -412,18 +526,41 @@ class RequestsManager:
             stop=stop # Pass stop parameter
         )
 
+    @staticmethod
+    def _normalize_timeout(timeout: Union[int, float, Tuple[int, int]]) -> Any:
+        """Expands a single number into a (connect, read) timeout tuple; other values are returned as-is."""
+        if isinstance(timeout, (int, float)):
+            return (timeout, timeout)
+        return timeout
+
+    @staticmethod
+    def _validate_method(method: str, stream: bool) -> str:
+        """Validates the HTTP method and streaming combination, returning the upper-cased method."""
+        method = method.upper()
+        if method not in RequestsManager._ALLOWED_METHODS:
+            raise ValueError(f"Unsupported HTTP method: {method}. Supported methods are GET, POST, PUT and DELETE.")
+
+        if stream and method != "POST":
+            raise ValueError("Streaming is only supported for POST requests in RequestsManager.")
+        return method
+
     @staticmethod
     # Remove the decorator from here, it will be applied dynamically or parameters passed
     # @retry(wait=wait_random_exponential(multiplier=1, max=40), stop=stop_after_attempt(3))
     def _execute_request_with_retry(session: requests.Session, url: str, headers: Dict[str, str],
                                    json_data: Dict[str, Any], timeout: Tuple[int, int],
                                    method: str, stream: bool,
-                                   wait: Any = wait_random_exponential(multiplier=1, max=40), # Add wait parameter
-                                   stop: Any = stop_after_attempt(3) # Add stop parameter
+                                   wait: Any = DEFAULT_RETRY_WAIT, # Add wait parameter
+                                   stop: Any = DEFAULT_RETRY_STOP # Add stop parameter
                                   ) -> requests.Response:
         """Internal method to execute the request with retry logic."""
-        # Apply retry dynamically using tenacity.Retrying
-        retryer = tenacity.Retrying(wait=wait, stop=stop)
+        # Apply retry dynamically using tenacity.Retrying; statuses already retried by the
+        # session adapter are raised as-is instead of being retried a second time
+        retryer = tenacity.Retrying(
+            wait=wait,
+            stop=stop,
+            retry=tenacity.retry_if_exception(partial(RequestsManager._should_retry, session)),
+        )
         return retryer(
             RequestsManager._execute_single_request,
             session=session,
@@ -435,6 +572,29 @@ class RequestsManager:
             stream=stream
         )
 
+    @staticmethod
+    def _has_status_retries(retry: Retry) -> bool:
+        """Tells whether an adapter's Retry allows at least one retry on a response status."""
+        budgets = [budget for budget in (retry.total, retry.status) if budget is not None]
+        return retry.total is not False and all(budget > 0 for budget in budgets)
+
+    @staticmethod
+    def _should_retry(session: requests.Session, exc: BaseException) -> bool:
+        """Tells whether the tenacity loop should retry a failed request.
+
+        HTTP errors whose status and method the session's adapter already retries, with a
+        retry budget of at least one, are not retried again, so a failing server sees max_retries + 1 requests instead of that
+        number multiplied by the tenacity attempts.
+        """
+        response = getattr(exc, "response", None)
+        if isinstance(exc, requests.exceptions.HTTPError) and response is not None and response.request is not None:
+            adapter_retry = getattr(session.get_adapter(response.request.url), "max_retries", None)
+            if (isinstance(adapter_retry, Retry)
+                    and RequestsManager._has_status_retries(adapter_retry)
+                    and adapter_retry.is_retry(response.request.method, response.status_code)):
+                return False
+        return True
+
     @staticmethod
     def _execute_single_request(session: requests.Session, url: str, headers: Dict[str, str],
                                 json_data: Dict[str, Any], timeout: Tuple[int, int],
@@ -458,16 +618,11 @@ class RequestsManager:
                 # The caller is responsible for iterating over response.iter_lines() or response.iter_content()
                 return response
             else:
-                # For normal (non-streaming) responses
-                if method == "GET":
-                    response = session.get(url, headers=headers, params=json_data, timeout=timeout)
-                elif method == "POST":
-                    response = session.post(url, headers=headers, json=json_data, timeout=timeout)
-                elif method == "PUT":
-                    response = session.put(url, headers=headers, json=json_data, timeout=timeout)
-                elif method == "DELETE":
-                    response = session.delete(url, headers=headers, json=json_data, timeout=timeout)
-                # No else needed here as method is validated in make_request
+                # For normal (non-streaming) responses; method is validated in make_request
+                session_method, payload_kwarg = RequestsManager._METHOD_DISPATCH[method]
+                response = getattr(session, session_method)(
+                    url, headers=headers, timeout=timeout, **{payload_kwarg: json_data}
+                )
 
                 response.raise_for_status()
                 # Return the raw response object
@@ -478,3 +633,140 @@ class RequestsManager:
             logging.error(error_msg)
             # Re-raise the original exception so tenacity can catch it
             raise e
+
+    @staticmethod
+    def iter_sse_json(response: requests.Response, chunk_size: int = 512) -> Generator[Any, None, None]:
+        """
+        Yields the JSON payloads of a Server-Sent Events streaming response.
+
+        Lines are matched as bytes, so keep-alives, comments and the final "[DONE]" marker
+        are skipped without being decoded. Payloads that are not valid JSON are logged
+        and skipped.
+
+        Args:
+            response: A streaming requests.Response (e.g. from make_request(..., stream=True))
+            chunk_size: Number of bytes read from the stream at a time
+
+        Yields:
+            The parsed JSON object of each "data:" line.
+        """
+        for line in response.iter_lines(chunk_size=chunk_size):
+            if not line.startswith(b"data:"):
+                continue
+            payload = line[5:].strip()
+            if not payload or payload == b"[DONE]":
+                continue
+            try:
+                yield json.loads(payload)
+            except json.JSONDecodeError as e:
+                logging.error(
+                    f"Error decoding JSON stream chunk: {e}, line: {payload.decode('utf-8', errors='replace')}"
+                )
+
+    @staticmethod
+    def _build_async_client() -> httpx.AsyncClient:
+        """Builds a new AsyncClient with the pool limits used by amake_request()."""
+        return httpx.AsyncClient(limits=RequestsManager._ASYNC_LIMITS)
+
+    @staticmethod
+    async def _close_on_loop_shutdown(
+        loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient
+    ) -> AsyncGenerator[None, None]:
+        """Async generator parked on its event loop until it is closed, which closes the client.
+
+        The loop closes every pending async generator on shutdown (asyncio.run() does so before
+        closing the loop), which releases the client even if aclose() was never called.
+        """
+        try:
+            yield
+        finally:
+            with RequestsManager._async_clients_lock:
+                entry = RequestsManager._async_clients.get(loop)
+                if entry is not None and entry[0] is client:
+                    del RequestsManager._async_clients[loop]
+            await client.aclose()
+
+    @staticmethod
+    async def _get_async_client() -> httpx.AsyncClient:
+        """Returns the running event loop's AsyncClient, creating it if it does not exist or was closed."""
+        loop = asyncio.get_running_loop()
+        with RequestsManager._async_clients_lock:
+            # Loops closed without shutting down their async generators leave their entry behind
+            for closed_loop in [other for other in RequestsManager._async_clients if other.is_closed()]:
+                del RequestsManager._async_clients[closed_loop]
+            entry = RequestsManager._async_clients.get(loop)
+            if entry is not None and not entry[0].is_closed:
+                return entry[0]
+            client = RequestsManager._build_async_client()
+            closer = RequestsManager._close_on_loop_shutdown(loop, client)
+            RequestsManager._async_clients[loop] = (client, closer)
+        # Starting the generator registers it with the loop, which closes it on shutdown
+        await closer.__anext__()
+        return client
+
+    @staticmethod
+    async def aclose() -> None:
+        """Closes the running event loop's AsyncClient used by amake_request()."""
+        with RequestsManager._async_clients_lock:
+            entry = RequestsManager._async_clients.get(asyncio.get_running_loop())
+        if entry is not None:
+            await entry[1].aclose()
+
+    @staticmethod
+    async def amake_request(url: str, headers: Dict[str, str], json_data: Dict[str, Any],
+                            timeout: Union[int, Tuple[int, int]] = (30, 30), method: str = "GET",
+                            stream: bool = False,
+                            wait: Any = DEFAULT_RETRY_WAIT,
+                            stop: Any = DEFAULT_RETRY_STOP
+                           ) -> httpx.Response:
+        """
+        Asynchronous counterpart of make_request, using the running event loop's httpx.AsyncClient.
+
+        Concurrent calls to the same host reuse the client's pooled keep-alive connections
+        instead of opening one connection per request. Each event loop gets its own client,
+        closed when the loop shuts down its async generators (as asyncio.run() does) or by
+        RequestsManager.aclose().
+
+        Args:
+            url: The URL to make the request to
+            headers: The headers to include in the request
+            json_data: The JSON data to include in the request body (query parameters for GET)
+            timeout: The request timeout in seconds or tuple of (connect, read) timeouts
+            method: HTTP method to use ("GET", "POST", "PUT" or "DELETE", defaults to "GET")
+            stream: Whether to stream the response (POST only)
+
+        Returns:
+            httpx.Response: The raw httpx.Response object. For stream=True the body is not read;
+                            the caller iterates response.aiter_lines() and must close it with
+                            response.aclose().
+
+        Raises:
+            tenacity.RetryError: If every attempt fails with an httpx.HTTPError
+            ValueError: If an unsupported HTTP method is specified
+        """
+        method = RequestsManager._validate_method(method, stream)
+
+        connect_timeout, read_timeout = RequestsManager._normalize_timeout(timeout)
+
+        client = await RequestsManager._get_async_client()
+        request = client.build_request(
+            method,
+            url,
+            headers=headers,
+            params=json_data if method == "GET" else None,
+            json=None if method == "GET" else json_data,
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+        )
+
+        async for attempt in tenacity.AsyncRetrying(wait=wait, stop=stop):
+            with attempt:
+                try:
+                    response = await client.send(request, stream=stream)
+                    response.raise_for_status()
+                except httpx.HTTPError as e:
+                    if isinstance(e, httpx.HTTPStatusError):
+                        await e.response.aclose()
+                    logging.error(f"{method} request to {url} failed: {str(e)}")
+                    # Re-raise so tenacity can retry the request
+                    raise
+        return response
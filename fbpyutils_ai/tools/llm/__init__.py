@@ -2,11 +2,13 @@ from abc import abstractmethod
 import base64
 import json
 import os
+import random
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict, Any, Tuple, Union, Generator
-from jsonschema import ValidationError, validate
+from jsonschema import ValidationError, validators
 import requests
-from tenacity import wait_random_exponential, stop_after_attempt
+import tenacity
 import tiktoken
 
 from fbpyutils_ai.tools import LLMService, LLMServiceModel
@@ -26,6 +28,27 @@ from fbpyutils_ai import logging
     LLM_INTROSPECTION_VALIDATION_SCHEMA,
 ) = get_llm_resources()
 
+# Validator compiled once for the introspection schema; jsonschema.validate would
+# re-check the schema and rebuild the validator on every introspection attempt.
+_introspection_validator_cls = validators.validator_for(LLM_INTROSPECTION_VALIDATION_SCHEMA)
+_introspection_validator_cls.check_schema(LLM_INTROSPECTION_VALIDATION_SCHEMA)
+LLM_INTROSPECTION_VALIDATOR = _introspection_validator_cls(LLM_INTROSPECTION_VALIDATION_SCHEMA)
+
+# Exponential backoff with jitter between introspection attempts, capped at 30 seconds
+INTROSPECTION_BACKOFF_BASE = 0.5
+INTROSPECTION_BACKOFF_MAX = 30.0
+
+# Sleep used between introspection attempts; module-level so tests can replace it
+_sleep = tenacity.nap.sleep
+
+
+def _introspection_backoff(attempt: int) -> float:
+    """Returns the delay in seconds to wait after the given failed introspection attempt (1-based)."""
+    return min(
+        INTROSPECTION_BACKOFF_BASE * 2 ** (attempt - 1) + random.random(),
+        INTROSPECTION_BACKOFF_MAX,
+    )
+
 
 class OpenAILLMService(LLMService):
     _request_semaphore = threading.Semaphore(int(os.environ.get("FBPY_SEMAPHORES", 4)))
@@ -40,7 +63,9 @@ class OpenAILLMService(LLMService):
     ):
         super().__init__(base_model, embed_model, vision_model, timeout, retries)
         self.session = RequestsManager.create_session()
-        self.session.headers.update(basic_header())
+        # The session is shared with other callers, so keep the default headers on the instance
+        self.headers = self.session.headers.copy()
+        self.headers.update(basic_header())
 
     def _resolve_model(self, model_type: str = "base") -> LLMServiceModel:
         try:
@@ -50,7 +75,7 @@ class OpenAILLMService(LLMService):
             return self._resolve_model()
         
     def _resolve_headers(self, model: LLMServiceModel) -> Dict[str, str]:
-        headers = self.session.headers.copy()
+        headers = self.headers.copy()
         headers["Content-Type"] = "application/json"
         headers['Authorization'] = f"Bearer {model.api_key}"
         if model.provider == "anthropic":
@@ -84,7 +109,7 @@ class OpenAILLMService(LLMService):
                                for non-streaming or iterating over response.iter_lines()
                                for streaming).
         """
-        headers = headers or self.session.headers.copy()
+        headers = headers or self.headers.copy()
 
         json_data = json_data or {}
         method = (method or "POST").upper()
@@ -103,17 +128,22 @@ class OpenAILLMService(LLMService):
             # Return the raw response object. Caller is responsible for parsing.
             return response
 
-    def generate_embeddings(self, input: List[str]) -> Optional[List[float]]:
-        logging.info(f"generate_embeddings called with input: {input[:50]}...")
+    def generate_embeddings(
+        self, input: Union[str, List[str]]
+    ) -> Optional[Union[List[float], List[List[float]]]]:
         """
-        Generates an embedding for a given text using the OpenAI API.
+        Generates embeddings for a text or a batch of texts using the OpenAI API.
+
+        A list of texts is sent to the embeddings endpoint in a single request.
 
         Args:
-            text (str): Text for which the embedding will be generated.
+            input (Union[str, List[str]]): Text, or list of texts, for which embeddings will be generated.
 
         Returns:
-            Optional[List[float]]: List of floats representing the embedding or None in case of an error.
+            Optional[Union[List[float], List[List[float]]]]: The embedding for a single text, or one
+                embedding per text (in input order) for a list. None in case of an error.
         """
+        logging.info(f"generate_embeddings called with input: {input[:50]}...")
         model = self.model_map["embed"]
         headers = self._resolve_headers(model)
         url = f"{model.api_base_url}/embeddings"
@@ -126,8 +156,13 @@ class OpenAILLMService(LLMService):
                 url, headers, data, timeout=self.timeout, stream=False
             )
             result = response.json()
-            logging.info(f"generate_embeddings successful, returning result: {result['data'][0]['embedding'][:50]}...")
-            return result["data"][0]["embedding"]
+            # Embeddings carry the position of their input; keep them in input order
+            embeddings = [
+                item["embedding"]
+                for item in sorted(result["data"], key=lambda item: item.get("index", 0))
+            ]
+            logging.info(f"generate_embeddings successful, returning {len(embeddings)} embedding(s): {embeddings[0][:50]}...")
+            return embeddings[0] if isinstance(input, str) else embeddings
         except (KeyError, IndexError) as e:
             logging.error(f"Error parsing OpenAI response: {e}")
             return None
@@ -199,18 +234,7 @@ class OpenAILLMService(LLMService):
 
             if stream:
                 # Handle streaming response
-                def generate_stream():
-                    for line in response.iter_lines():
-                        if line:
-                            line = line.decode('utf-8')
-                            if line.startswith('data:') and not 'data: [DONE]' in line:
-                                json_str = line[5:].strip()
-                                if json_str:
-                                    try:
-                                        yield json.loads(json_str)
-                                    except json.JSONDecodeError as e:
-                                        logging.error(f"Error decoding JSON stream chunk: {e}, line: {json_str}")
-                return generate_stream()
+                return RequestsManager.iter_sse_json(response)
             else:
                 # Handle non-streaming response
                 result = response.json()
@@ -360,13 +384,14 @@ class OpenAILLMService(LLMService):
                     model_details = {}
                     if contents:
                         try:
-                            model_details = json.loads(
-                                contents.replace("```json", "").replace("```", "")
-                            )
-                            validate(
-                                instance=model_details,
-                                schema=LLM_INTROSPECTION_VALIDATION_SCHEMA,
-                            )
+                            try:
+                                model_details = json.loads(contents)
+                            except json.JSONDecodeError:
+                                # Only strip Markdown code fences when the reply is not plain JSON
+                                model_details = json.loads(
+                                    contents.replace("```json", "").replace("```", "")
+                                )
+                            LLM_INTROSPECTION_VALIDATOR.validate(model_details)
                             introspection_report["generation_ok"] = True
                         except ValidationError as e:
                             parse_error = f"JSON Validation error: {e}. JSON: {model_details}"
@@ -409,11 +434,11 @@ class OpenAILLMService(LLMService):
                     },
                 ]
 
-                while (
-                    (introspection_report["attempts"] <= retries) and (not introspection_report["generation_ok"])
-                ):
+                def _attempt_introspection() -> Optional[str]:
+                    """Runs one introspection attempt, returning the parse error or None on success."""
+                    nonlocal introspection_report, llm_model_details
                     attempt_no = introspection_report["attempts"]
-                    logging.info(f"Performing model introspection for: {model_id}. Attempt #{attempt_no+1}.")
+                    logging.info(f"Performing model introspection for: {model_id}. Attempt #{attempt_no}.")
 
                     try:
                         response = self.generate_completions(
@@ -430,8 +455,8 @@ class OpenAILLMService(LLMService):
                             llm_model_details
                         ) = _parse_response(response, introspection_report)
                     except Exception as e:
-                        parse_error = f"An error occurred while fetching model details from the LLM: {e.message}."
-                        response = f"Attempt #{attempt_no+1} failed with error: {parse_error}."
+                        parse_error = f"An error occurred while fetching model details from the LLM: {e}."
+                        response = f"Attempt #{attempt_no} failed with error: {parse_error}."
                         logging.info(parse_error)
 
                     if parse_error is not None:
@@ -443,11 +468,24 @@ class OpenAILLMService(LLMService):
                             },
                             {
                                 "role": "user",
-                                "content": f"This is the attempt {attempt_no+1}/{retries}. The expected JSON format was not returned. Please try again and ensure the output is a valid JSON object an defined on the provided schema. The error was: {parse_error}",
+                                "content": f"This is the attempt {attempt_no}/{retries}. The expected JSON format was not returned. Please try again and ensure the output is a valid JSON object an defined on the provided schema. The error was: {parse_error}",
                             }
                         ]:
                             messages.append(m)
-                        
+                    return parse_error
+
+                # Retry only failed attempts (a parse error is returned), backing off between them
+                # so rate-limited providers are not hammered; after the last one, fall through
+                # to sanitization instead of raising
+                retryer = tenacity.Retrying(
+                    stop=tenacity.stop_after_attempt(retries),
+                    wait=lambda retry_state: _introspection_backoff(retry_state.attempt_number),
+                    retry=tenacity.retry_if_result(lambda parse_error: parse_error is not None),
+                    retry_error_callback=lambda retry_state: retry_state.outcome.result(),
+                    sleep=_sleep,
+                )
+                retryer(_attempt_introspection)
+
                 if not introspection_report["generation_ok"]:
                     sanitized_details, sanitize_changes = sanitize_model_details(
                         llm_model_details, LLM_INTROSPECTION_VALIDATION_SCHEMA
@@ -519,3 +557,40 @@ class OpenAILLMService(LLMService):
             models.append(model)
 
         return models
+
+    def list_models_batch(
+        self, model_types: Tuple[str, ...] = ("base", "embed", "vision"), **kwargs: Any
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Lists the models available to several of the configured model types concurrently.
+
+        Model types whose models share the same API base URL and key are fetched with a
+        single request; distinct endpoints are queried in parallel threads.
+
+        Args:
+            model_types: The model_map keys to list models for. Defaults to all of them.
+            **kwargs: Extra arguments passed to list_models (e.g. timeout).
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: The list_models result for each requested model type.
+
+        Raises:
+            KeyError: If a model type is not configured.
+            requests.exceptions.RequestException: If any of the endpoints fails.
+        """
+        endpoints = {
+            model_type: (self.model_map[model_type].api_base_url, self.model_map[model_type].api_key)
+            for model_type in model_types
+        }
+        unique_endpoints = list(dict.fromkeys(endpoints.values()))
+        if not unique_endpoints:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=len(unique_endpoints)) as executor:
+            futures = {
+                endpoint: executor.submit(self.list_models, *endpoint, **kwargs)
+                for endpoint in unique_endpoints
+            }
+            results = {endpoint: future.result() for endpoint, future in futures.items()}
+
+        return {model_type: results[endpoint] for model_type, endpoint in endpoints.items()}
@@ -1,5 +1,6 @@
 import json
 import os
+from functools import lru_cache
 
 import pandas as pd
 import requests
@@ -10,6 +11,14 @@ from fbpyutils_ai.tools.http import RequestsManager, basic_header
 from fbpyutils_ai import logging
 
 
+# Resource files shipped with the package, resolved once relative to this module
+# rather than to the current working directory
+_RESOURCES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources")
+_PROMPT_PATH = os.path.join(_RESOURCES_DIR, "llm_introspection_prompt.md")
+_SCHEMA_PATH = os.path.join(_RESOURCES_DIR, "llm_introspection_validation_schema.json")
+_PROVIDERS_PATH = os.path.join(_RESOURCES_DIR, "llm_providers.md")
+
+
 def get_api_model_response(
     url: str, api_key: str, **kwargs: Any
 ) -> requests.Response:
@@ -58,35 +67,26 @@ def get_llm_model(
         return llm_model
 
 
+@lru_cache(maxsize=1)
 def get_llm_resources():
+    """
+    Loads the LLM resource files: the providers table, the introspection prompt and
+    the introspection validation schema.
+
+    The files are read and parsed once per process; later calls return the cached
+    objects, which callers must treat as read-only. Use get_llm_resources.cache_clear()
+    to force a reload.
+    """
     def _strip(x: str) -> str:
         while "  " in x:
             x = x.replace("  ", "")
         return x.strip()
 
-    prompt_path = os.path.join(
-        "fbpyutils_ai", "tools", "llm", "resources", "llm_introspection_prompt.md"
-    )
-    schema_path = os.path.join(
-        "fbpyutils_ai",
-        "tools",
-        "llm",
-        "resources",
-        "llm_introspection_validation_schema.json",
-    )
-    endpoints_path = os.path.join(
-        "fbpyutils_ai",
-        "tools",
-        "llm",
-        "resources",
-        "llm_providers.md",
-    )
-
-    with open(prompt_path, "r", encoding="utf-8") as f:
+    with open(_PROMPT_PATH, "r", encoding="utf-8") as f:
         llm_introspection_prompt = f.read()
-    with open(schema_path, "r", encoding="utf-8") as f:
+    with open(_SCHEMA_PATH, "r", encoding="utf-8") as f:
         llm_introspection_validation_schema = json.load(f)
-    with open(endpoints_path, "r", encoding="utf-8") as f:
+    with open(_PROVIDERS_PATH, "r", encoding="utf-8") as f:
         llm_endpoints_raw = f.read()
 
     lines = llm_endpoints_raw.strip().split('\n')
@@ -431,9 +431,7 @@ def _(
     if llm_generate_embeddings_input.value:
         with mo.status.spinner(title="Generating embeddings...") as _spinner:
             try:
-                generated_embeddings = llm.generate_embedding(
-                    text=value,
-                )
+                generated_embeddings = llm.generate_embeddings(value)
                 llm_generate_embeddings_output.value = generated_embeddings
                 _spinner.update("Done!")
             except Exception as e:
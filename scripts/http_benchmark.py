@@ -0,0 +1,142 @@
+"""Ping-pong throughput benchmark for RequestsManager against a local WSGI server.
+
+Run it from the repository root with:
+
+    uv run python scripts/http_benchmark.py [--requests 1000] [--workers 16]
+
+Each round sends the same number of requests and prints the elapsed time and throughput.
+The numbers depend on the machine, so they are reported rather than asserted.
+"""
+import argparse
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from socketserver import ThreadingMixIn
+from typing import Callable, Iterator, List, Tuple
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+import requests
+
+from fbpyutils_ai.tools.http import RequestsManager
+
+
+_PONG_BODY = b'{"pong": true}'
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class _ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    """WSGI server handling each connection in its own thread, for the concurrent rounds."""
+
+    daemon_threads = True
+
+
+class _QuietHandler(WSGIRequestHandler):
+    """Request handler that does not write a log line per request to stderr."""
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _pong_app(environ, start_response):
+    """WSGI application that always answers 200 with a fixed JSON body."""
+    start_response(
+        "200 OK",
+        [("Content-Type", "application/json"), ("Content-Length", str(len(_PONG_BODY)))],
+    )
+    return [_PONG_BODY]
+
+
+def _start_server() -> Tuple[_ThreadingWSGIServer, threading.Thread, str]:
+    """Starts the ping-pong server on a background thread and returns it with its URL."""
+    server = make_server(
+        "127.0.0.1", 0, _pong_app, server_class=_ThreadingWSGIServer, handler_class=_QuietHandler
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, thread, f"http://127.0.0.1:{server.server_port}/ping"
+
+
+def _ping(session: requests.Session, url: str) -> int:
+    return RequestsManager.make_request(
+        session=session, url=url, headers=_JSON_HEADERS, json_data={}, timeout=5
+    ).status_code
+
+
+def _sequential_session_per_call(url: str, total: int, workers: int) -> List[int]:
+    statuses = []
+    for _ in range(total):
+        with requests.Session() as session:
+            statuses.append(_ping(session, url))
+    return statuses
+
+
+def _sequential_shared_session(url: str, total: int, workers: int) -> List[int]:
+    shared = RequestsManager.create_session()
+    return [_ping(shared, url) for _ in range(total)]
+
+
+def _concurrent_shared_session(url: str, total: int, workers: int) -> List[int]:
+    shared = RequestsManager.create_session()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda _: _ping(shared, url), range(total)))
+
+
+def _concurrent_async_client(url: str, total: int, workers: int) -> List[int]:
+    async def _run() -> List[int]:
+        semaphore = asyncio.Semaphore(workers)
+
+        async def _aping() -> int:
+            async with semaphore:
+                response = await RequestsManager.amake_request(
+                    url=url, headers=_JSON_HEADERS, json_data={}, timeout=5
+                )
+                return response.status_code
+
+        try:
+            return list(await asyncio.gather(*(_aping() for _ in range(total))))
+        finally:
+            await RequestsManager.aclose()
+
+    return asyncio.run(_run())
+
+
+_ROUNDS: Tuple[Tuple[str, Callable[[str, int, int], List[int]]], ...] = (
+    ("sequential, session per call", _sequential_session_per_call),
+    ("sequential, shared session", _sequential_shared_session),
+    ("concurrent, shared session", _concurrent_shared_session),
+    ("concurrent, httpx.AsyncClient", _concurrent_async_client),
+)
+
+
+def _run_rounds(url: str, total: int, workers: int) -> Iterator[Tuple[str, float]]:
+    for label, round_fn in _ROUNDS:
+        start = time.perf_counter()
+        statuses = round_fn(url, total, workers)
+        elapsed = time.perf_counter() - start
+        if statuses != [200] * total:
+            raise RuntimeError(f"{label}: unexpected response statuses")
+        yield label, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=1000, help="requests per round")
+    parser.add_argument("--workers", type=int, default=16, help="concurrency of the concurrent rounds")
+    args = parser.parse_args()
+
+    server, thread, url = _start_server()
+    try:
+        for label, elapsed in _run_rounds(url, args.requests, args.workers):
+            print(
+                f"{label:<32} {args.requests} requests in {elapsed:.3f}s "
+                f"({args.requests / elapsed:.0f} req/s)"
+            )
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+if __name__ == "__main__":
+    main()
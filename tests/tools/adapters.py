@@ -0,0 +1,38 @@
+import json
+from collections import deque
+from typing import Any, Iterable, Union
+
+import requests
+from requests.adapters import BaseAdapter
+
+
+def json_response(payload: Any, status_code: int = 200) -> requests.Response:
+    """Builds a real requests.Response carrying `payload` as its JSON body."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers["Content-Type"] = "application/json"
+    response._content = json.dumps(payload).encode("utf-8")
+    return response
+
+
+class ScriptedAdapter(BaseAdapter):
+    """Transport adapter that replays scripted outcomes (exceptions or responses) in order.
+
+    Outcomes can be passed up front or appended to `outcomes` later; every request sent
+    through the adapter is recorded in `requests`.
+    """
+
+    def __init__(self, outcomes: Iterable[Union[requests.Response, BaseException]] = ()):
+        super().__init__()
+        self.outcomes = deque(outcomes)
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        outcome = self.outcomes.popleft()
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    def close(self):
+        pass
@@ -0,0 +1,62 @@
+import inspect
+from pathlib import Path
+from typing import Callable, Dict, Tuple
+
+import pytest
+import pytest_asyncio
+
+from fbpyutils_ai.tools.http import HTTPClient
+
+
+DEFAULT_BASE_URL = "https://api.example.com"
+HTTP_ASYNC_XDIST_GROUP = "http_async"
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """Puts the async HTTP tests in one xdist group.
+
+    With `pytest -n auto --dist=loadgroup` they all run on the same worker, sharing its
+    session event loop and cached clients instead of building them on every worker.
+    """
+    tests_dir = Path(__file__).parent
+    for item in items:
+        if tests_dir in item.path.parents and inspect.iscoroutinefunction(
+            getattr(item, "function", None)
+        ):
+            item.add_marker(pytest.mark.xdist_group(HTTP_ASYNC_XDIST_GROUP))
+
+
+@pytest_asyncio.fixture(scope="session")
+async def http_client_factory():
+    """Session-wide factory returning one cached HTTPClient per (base_url, verify_ssl).
+
+    Building an HTTPClient creates real httpx clients (SSL context, transport, pool), so each
+    configuration is built once and closed when the session ends. Tests must not use the
+    cached clients in `with` blocks, which would close them for every later test.
+    """
+    clients: Dict[Tuple[str, bool], HTTPClient] = {}
+
+    def factory(base_url: str = DEFAULT_BASE_URL, verify_ssl: bool = True) -> HTTPClient:
+        key = (base_url, verify_ssl)
+        if key not in clients:
+            clients[key] = HTTPClient(base_url=base_url, verify_ssl=verify_ssl)
+        return clients[key]
+
+    yield factory
+    for client in clients.values():
+        client._sync_client.close()
+        await client._async_client.aclose()
+
+
+@pytest.fixture
+def http_client(http_client_factory: Callable[..., HTTPClient]) -> HTTPClient:
+    """The cached default HTTPClient, with its httpx clients restored after the test.
+
+    Tests inject mocks into `_sync_client` or `_async_client`; putting the real clients back
+    keeps those mocks from leaking into the next test.
+    """
+    client = http_client_factory()
+    sync_client, async_client = client._sync_client, client._async_client
+    yield client
+    client._sync_client, client._async_client = sync_client, async_client
@@ -1,38 +1,95 @@
+import asyncio
+import gzip
+import io
 import json
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import MappingProxyType
+from unittest.mock import MagicMock
+
+import httpx
 import pytest
+import pytest_asyncio
 import requests
-from unittest.mock import patch, MagicMock
-from requests.exceptions import Timeout, RequestException
-import tenacity # Import tenacity for RetryError
-from tenacity import stop_after_attempt, wait_fixed, RetryError # Import specific tenacity components and RetryError
+import tenacity
+import urllib3
 from requests.adapters import HTTPAdapter
-from tenacity.wait import wait_base # Import wait_base for type checking
-from tenacity.stop import stop_base # Import stop_base for type checking
-from tenacity.wait import wait_base # Import wait_base for type checking
-from tenacity.stop import stop_base # Import stop_base for type checking
+from requests.exceptions import Timeout, RequestException
 
 from fbpyutils_ai.tools.http import RequestsManager
+from tests.tools.adapters import ScriptedAdapter
+
+
+# Read-only request headers shared by every test; equal to the plain dict in call assertions
+_JSON_HEADERS = MappingProxyType({"Content-Type": "application/json"})
+
+
+def _consumed_response(content: bytes) -> requests.Response:
+    """Builds a real, already-consumed requests.Response with a JSON body."""
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = "application/json"
+    response._content = content
+    response._content_consumed = True
+    return response
+
+
+# Real responses built once at import; tests only read them, so they are safe to share
+_RESP_SUCCESS_DATA = _consumed_response(b'{"success": true, "data": "test_data"}')
+_RESP_SUCCESS = _consumed_response(b'{"success": true}')
+
+# SSE stream lines, joined into one body so the real iter_lines() splits them in a single pass
+_STREAM_LINES = (
+    b'data: {"id": 1, "content": "first chunk"}',
+    b'data: {"id": 2, "content": "second chunk"}',
+    b'data: [DONE]',  # This should be ignored
+)
+_STREAM_BODY = b"\n".join(_STREAM_LINES)
+
+
+def _streaming_response() -> requests.Response:
+    """Builds an unconsumed SSE requests.Response whose raw body is read chunk by chunk."""
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = "text/event-stream"
+    response.raw = io.BytesIO(_STREAM_BODY)
+    return response
 
-@pytest.fixture  
+
+@pytest.fixture(scope="module")
+def scripted_session():
+    """Real requests.Session shared by the module; tests mount a ScriptedAdapter for https://test.com/."""
+    session = requests.Session()
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="module")
 def mock_session():
-    session = MagicMock()
-    return session
+    """Session mock specced on requests.Session, built once per module and reset after every test."""
+    return MagicMock(spec=requests.Session)
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock_session(mock_session):
+    yield
+    # reset_mock() on the parent does not clear the children's return_value/side_effect
+    for method in ("get", "post", "put", "delete"):
+        getattr(mock_session, method).reset_mock(return_value=True, side_effect=True)
+    mock_session.reset_mock()
 
 def test_make_request_success_post(mock_session):
     """Test successful POST request with normal response"""
-    # Setup mock response
-    # Setup mock response using a real requests.Response object
-    mock_response = requests.Response()
-    mock_response.status_code = 200
-    # Mock the json method on the real Response object
-    mock_response.json = MagicMock(return_value={"success": True, "data": "test_data"})
-    mock_session.post.return_value = mock_response
+    # Setup mock response using the prebuilt requests.Response
+    mock_session.post.return_value = _RESP_SUCCESS_DATA
     
     # Make the request with POST method
     result = RequestsManager.make_request(
         session=mock_session,
         url="https://test.com/api",
-        headers={"Content-Type": "application/json"},
+        headers=_JSON_HEADERS,
         json_data={"test": "data"},
         timeout=10,
         method="POST",
@@ -42,7 +99,7 @@ def test_make_request_success_post(mock_session):
     # Verify request was made correctly
     mock_session.post.assert_called_once_with(
         "https://test.com/api",
-        headers={"Content-Type": "application/json"},
+        headers=_JSON_HEADERS,
         json={"test": "data"},
         timeout=(10, 10)  # Expect tuple after internal conversion
     )
@@ -53,19 +110,14 @@ def test_make_request_success_post(mock_session):
     
 def test_make_request_success_get(mock_session):
     """Test successful GET request with normal response"""
-    # Setup mock response
-    # Setup mock response using a real requests.Response object
-    mock_response = requests.Response()
-    mock_response.status_code = 200
-    # Mock the json method on the real Response object
-    mock_response.json = MagicMock(return_value={"success": True, "data": "test_data"})
-    mock_session.get.return_value = mock_response
+    # Setup mock response using the prebuilt requests.Response
+    mock_session.get.return_value = _RESP_SUCCESS_DATA
     
     # Make the request with GET method (the default)
     result = RequestsManager.make_request(
         session=mock_session,
         url="https://test.com/api",
-        headers={"Content-Type": "application/json"},
+        headers=_JSON_HEADERS,
         json_data={"test": "data"},
         timeout=10,
         stream=False
@@ -74,7 +126,7 @@ def test_make_request_success_get(mock_session):
     # Verify request was made correctly
     mock_session.get.assert_called_once_with(
         "https://test.com/api",
-        headers={"Content-Type": "application/json"},
+        headers=_JSON_HEADERS,
         params={"test": "data"},  # Note: GET uses params instead of json
         timeout=(10, 10)  # Expect tuple after internal conversion
     )
@@ -83,25 +135,36 @@ def test_make_request_success_get(mock_session):
     assert isinstance(result, requests.Response)
     assert result.json() == {"success": True, "data": "test_data"}
 
-def test_make_request_streaming(mock_session):
-    """Test successful request with streaming response"""
-    # Setup mock response
-    # Setup mock response using a real requests.Response object
-    mock_response = requests.Response()
-    mock_response.status_code = 200
-    # Mock iter_lines to return some data lines
-    mock_response.iter_lines = MagicMock(return_value=[
-        b'data: {"id": 1, "content": "first chunk"}',
-        b'data: {"id": 2, "content": "second chunk"}',
-        b'data: [DONE]'  # This should be ignored
-    ])
-    mock_session.post.return_value = mock_response
+@pytest.mark.parametrize(
+    "timeout, expected",
+    [(10, (10, 10)), (2.5, (2.5, 2.5)), ((3, 30), (3, 30)), ([3, 30], [3, 30])],
+    ids=["int", "float", "tuple", "list"],
+)
+def test_make_request_timeout_forms(mock_session, timeout, expected):
+    """Test that numeric timeouts are expanded to a pair and other forms, even unhashable ones, pass through"""
+    mock_session.get.return_value = _RESP_SUCCESS_DATA
+
+    RequestsManager.make_request(
+        session=mock_session,
+        url="https://test.com/api",
+        headers=_JSON_HEADERS,
+        json_data={},
+        timeout=timeout,
+    )
+
+    assert mock_session.get.call_args.kwargs["timeout"] == expected
+
+@pytest.mark.parametrize("chunk_size", [512, 16], ids=["whole_lines", "fragmented_lines"])
+def test_make_request_streaming(mock_session, chunk_size):
+    """Test successful request with streaming response, read whole or in line fragments"""
+    # Fresh response per test: the raw stream can only be consumed once
+    mock_session.post.return_value = _streaming_response()
     
     # Make the streaming request - note that streaming forces POST even if method is GET
     response = RequestsManager.make_request(
         session=mock_session,
         url="https://test.com/api/stream",
-        headers={"Content-Type": "application/json"},
+        headers=_JSON_HEADERS,
         json_data={"test": "data"},
         timeout=10,
         method="POST", # Streaming requires POST in RequestsManager
@@ -111,7 +174,7 @@ def test_make_request_streaming(mock_session):
     # Verify request was made correctly with POST method
     mock_session.post.assert_called_once_with(
         "https://test.com/api/stream",
-        headers={"Content-Type": "application/json"},
+        headers=_JSON_HEADERS,
         json={"test": "data"},
         timeout=(10, 10), # Expect tuple after internal conversion
         stream=True
@@ -120,24 +183,51 @@ def test_make_request_streaming(mock_session):
     # Verify that a requests.Response object is returned
     assert isinstance(response, requests.Response)
     
-    # Simulate client consuming the stream and parsing JSON
-    results = []
-    for line in response.iter_lines():
-        if line:
-            line = line.decode('utf-8')
-            if line.startswith('data:') and not 'data: [DONE]' in line:
-                json_str = line[5:].strip()
-                if json_str:
-                    try:
-                        results.append(json.loads(json_str))
-                    except json.JSONDecodeError:
-                        pytest.fail(f"Failed to decode JSON from stream line: {json_str}")
+    # Consume the stream through the SSE helper, as the LLM service does
+    results = list(RequestsManager.iter_sse_json(response, chunk_size=chunk_size))
 
     # Verify results (should have 2 items, not including the [DONE] marker)
     assert len(results) == 2
     assert results[0] == {"id": 1, "content": "first chunk"}
     assert results[1] == {"id": 2, "content": "second chunk"}
 
+def test_make_request_gzip_streaming(mock_session):
+    """Test that a gzip streaming response is returned unread and decompressed incrementally"""
+    payload = json.dumps({"items": [{"id": i, "content": "chunk"} for i in range(20000)]}).encode("utf-8")
+    compressed = gzip.compress(payload, compresslevel=1)
+    raw_body = io.BytesIO(compressed)
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Encoding"] = "gzip"
+    response.raw = urllib3.HTTPResponse(
+        body=raw_body,
+        headers={"Content-Encoding": "gzip"},
+        status=200,
+        preload_content=False,
+        decode_content=True,
+    )
+    mock_session.post.return_value = response
+
+    result = RequestsManager.make_request(
+        session=mock_session,
+        url="https://test.com/api/stream",
+        headers=_JSON_HEADERS,
+        json_data={"test": "data"},
+        timeout=10,
+        method="POST",
+        stream=True
+    )
+
+    # make_request must hand back the stream without touching the compressed body
+    assert result is response
+    assert raw_body.tell() == 0
+
+    chunks = list(result.iter_content(chunk_size=8192))
+    assert len(chunks) > 1
+    assert max(len(chunk) for chunk in chunks) <= 8192
+    assert json.loads(b"".join(chunks)) == json.loads(payload)
+
+@pytest.mark.slow
 def test_make_request_timeout_get(mock_session):
     """Test GET request that times out"""
     # Setup mock to raise Timeout
@@ -149,7 +239,7 @@ def test_make_request_timeout_get(mock_session):
         RequestsManager.make_request(
             session=mock_session,
             url="https://test.com/api",
-            headers={"Content-Type": "application/json"},
+            headers=_JSON_HEADERS,
             json_data={"test": "data"},
             timeout=10,
             method="GET",
@@ -161,6 +251,7 @@ def test_make_request_timeout_get(mock_session):
     # Verify the mock was called the expected number of times (3 attempts)
     assert mock_session.get.call_count == 3
         
+@pytest.mark.slow
 def test_make_request_timeout_post(mock_session):
     """Test POST request that times out"""
     # Setup mock to raise Timeout
@@ -172,7 +263,7 @@ def test_make_request_timeout_post(mock_session):
         RequestsManager.make_request(
             session=mock_session,
             url="https://test.com/api",
-            headers={"Content-Type": "application/json"},
+            headers=_JSON_HEADERS,
             json_data={"test": "data"},
             timeout=10,
             method="POST",
@@ -184,6 +275,7 @@ def test_make_request_timeout_post(mock_session):
     # Verify the mock was called the expected number of times (3 attempts)
     assert mock_session.post.call_count == 3
 
+@pytest.mark.slow
 def test_make_request_error_post(mock_session):
     """Test POST request that fails with other error"""
     # Setup mock to raise RequestException
@@ -195,7 +287,7 @@ def test_make_request_error_post(mock_session):
         RequestsManager.make_request(
             session=mock_session,
             url="https://test.com/api",
-            headers={"Content-Type": "application/json"},
+            headers=_JSON_HEADERS,
             json_data={"test": "data"},
             timeout=10,
             method="POST",
@@ -207,6 +299,7 @@ def test_make_request_error_post(mock_session):
     # Verify the mock was called the expected number of times (3 attempts)
     assert mock_session.post.call_count == 3
         
+@pytest.mark.slow
 def test_make_request_error_get(mock_session):
     """Test GET request that fails with other error"""
     # Setup mock to raise RequestException
@@ -218,7 +311,7 @@ def test_make_request_error_get(mock_session):
         RequestsManager.make_request(
             session=mock_session,
             url="https://test.com/api",
-            headers={"Content-Type": "application/json"},
+            headers=_JSON_HEADERS,
             json_data={"test": "data"},
             timeout=10,
             method="GET",
@@ -230,95 +323,63 @@ def test_make_request_error_get(mock_session):
     # Verify the mock was called the expected number of times (3 attempts)
     assert mock_session.get.call_count == 3
 
-def test_retry_logic_post():
-    """Test that retry logic is applied to the POST method"""
-    with patch('requests.Session.post') as mock_post:
-        # Setup mock to raise RequestException twice, then succeed on third try
-        mock_response = requests.Response()
-        mock_response.status_code = 200
-        mock_response.json = MagicMock(return_value={"success": True})
-        mock_post.side_effect = [
-            RequestException("First failure"),
-            RequestException("Second failure"),
-            mock_response
-        ]
-        
-        # Create a session to test with
-        session = requests.Session()
-        
-        # Make the request, should succeed after retries
-        result = RequestsManager.make_request(
-            session=session,
-            url="https://test.com/api",
-            headers={"Content-Type": "application/json"},
-            json_data={"test": "data"},
-            timeout=10,
-            method="POST",
-            stream=False,
-            stop=tenacity.stop_after_attempt(3) # Explicitly pass stop parameter
-        )
-        
-        # Verify the result and that post was called 3 times
-        assert isinstance(result, requests.Response)
-        assert result.json() == {"success": True}
-        assert mock_post.call_count == 3
-        
-def test_retry_logic_get():
-    """Test that retry logic is applied to the GET method"""
-    with patch('requests.Session.get') as mock_get:
-        # Setup mock to raise RequestException twice, then succeed on third try
-        mock_response = requests.Response()
-        mock_response.status_code = 200
-        mock_response.json = MagicMock(return_value={"success": True})
-        mock_get.side_effect = [
-            RequestException("First failure"),
-            RequestException("Second failure"),
-            mock_response
-        ]
-        
-        # Create a session to test with
-        session = requests.Session()
-        
-        # Make the request, should succeed after retries
-        result = RequestsManager.make_request(
-            session=session,
-            url="https://test.com/api",
-            headers={"Content-Type": "application/json"},
-            json_data={"test": "data"},
-            timeout=10,
-            method="GET",
-            stream=False,
-            stop=tenacity.stop_after_attempt(3) # Explicitly pass stop parameter
-        )
-        
-        # Verify the result and that get was called 3 times
-        assert isinstance(result, requests.Response)
-        assert result.json() == {"success": True}
-        assert mock_get.call_count == 3
+@pytest.mark.slow
+@pytest.mark.parametrize("method", ["POST", "GET"])
+def test_retry_logic(scripted_session, method):
+    """Test that retry logic is applied to POST and GET requests"""
+    # Transport fails twice, then succeeds on the third try
+    adapter = ScriptedAdapter([
+        RequestException("First failure"),
+        RequestException("Second failure"),
+        _consumed_response(b'{"success": true}'),
+    ])
+    scripted_session.mount("https://test.com/", adapter)
 
-def test_invalid_method():
-    """Test handling of invalid HTTP method"""
-    session = requests.Session()
-    
-    # Make the request with an invalid method
-    # Expect ValueError directly from validation for a truly unsupported method
-    with pytest.raises(ValueError) as excinfo:
-        RequestsManager.make_request(
-            session=session,
-            url="https://test.com/api",
-            headers={"Content-Type": "application/json"},
-            json_data={"test": "data"},
-            timeout=10,
-            method="PATCH",  # Truly unsupported method
-            stream=False
-        )
-    
-    # Verify the error message
-    assert "Unsupported HTTP method: PATCH" in str(excinfo.value)
+    # Make the request, should succeed after retries
+    result = RequestsManager.make_request(
+        session=scripted_session,
+        url="https://test.com/api",
+        headers=_JSON_HEADERS,
+        json_data={"test": "data"},
+        timeout=10,
+        method=method,
+        stream=False,
+        stop=tenacity.stop_after_attempt(3) # Explicitly pass stop parameter
+    )
+
+    # Verify the result and that the transport was hit 3 times with the same request
+    assert isinstance(result, requests.Response)
+    assert result.json() == {"success": True}
+    assert [request.method for request in adapter.requests] == [method] * 3
+
+def test_invalid_method(mock_session):
+    """Test handling of invalid HTTP methods"""
+    # Expect ValueError directly from validation for truly unsupported methods,
+    # checked in one test since they share no state
+    for method in ("PATCH", "HEAD", "OPTIONS"):
+        with pytest.raises(ValueError, match=f"Unsupported HTTP method: {method}"):
+            RequestsManager.make_request(
+                session=mock_session,
+                url="https://test.com/api",
+                headers=_JSON_HEADERS,
+                json_data={"test": "data"},
+                timeout=10,
+                method=method,
+                stream=False
+            )
+
+    # Validation happens before any request is sent
+    mock_session.assert_not_called()
+    assert mock_session.method_calls == []
 
-def test_create_session():
-    """Test that create_session returns a properly configured Session"""
+def test_create_session(monkeypatch):
+    """Test that create_session returns a properly configured, shared Session"""
+    monkeypatch.setattr(RequestsManager, '_session_cache', OrderedDict())
     session = RequestsManager.create_session(max_retries=3)
+
+    # Same configuration returns the same cached Session
+    assert RequestsManager.create_session(max_retries=3) is session
+    assert RequestsManager.create_session(max_retries=3, verify_ssl=False) is not session
     
     # Check that it's a Session object
     assert isinstance(session, requests.Session)
@@ -329,54 +390,377 @@ def test_create_session():
     # Check max_retries is set correctly for https adapter
     https_adapter = session.adapters.get('https://')
     assert https_adapter.max_retries.total == 3
+    assert set(https_adapter.max_retries.status_forcelist) == {429, 502, 503, 504}
+    assert https_adapter.max_retries.allowed_methods == frozenset(["GET", "POST"])
+    assert https_adapter.max_retries.raise_on_status is False
+    assert (https_adapter.max_retries.connect, https_adapter.max_retries.read) == (0, 0)
+
+
+class _UnavailableHandler(BaseHTTPRequestHandler):
+    """Answers every request with 503 and Retry-After: 0, counting the requests it receives."""
+
+    status = 503
+    request_count = 0
+
+    def _answer(self):
+        type(self).request_count += 1
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(self.status)
+        if self.status == 503:
+            self.send_header("Retry-After", "0")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    do_GET = do_POST = do_PUT = _answer
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _OkHandler(_UnavailableHandler):
+    """Answers every request with an empty 200, counting the requests it receives."""
+
+    status = 200
+    request_count = 0
+
+
+@contextmanager
+def _local_server(handler):
+    """Serves `handler` on a local port from a background thread, yielding the base URL."""
+    handler.request_count = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/api"
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+@pytest.fixture
+def unavailable_server():
+    """Local HTTP server that always answers 503; yields its handler class and base URL."""
+    with _local_server(_UnavailableHandler) as url:
+        yield _UnavailableHandler, url
+
 
-def test_request_convenience_method():
-    """Test the convenience request method that creates a session and makes a request"""
+@pytest.fixture
+def ok_server():
+    """Local HTTP server that always answers 200; yields its handler class and base URL."""
+    with _local_server(_OkHandler) as url:
+        yield _OkHandler, url
+
+
+@pytest.mark.parametrize(
+    "method, max_retries, expected_requests",
+    [
+        # Retried by the session adapter only: 1 request + max_retries
+        pytest.param("POST", 2, 3, id="adapter_retries_post"),
+        pytest.param("GET", 2, 3, id="adapter_retries_get"),
+        # Not retried by the adapter, so the tenacity loop makes every attempt
+        pytest.param("PUT", 2, 3, id="tenacity_retries_put"),
+        # The adapter has no retry budget, so the tenacity loop makes every attempt
+        pytest.param("POST", 0, 3, id="no_adapter_retries_post"),
+    ],
+)
+def test_failing_server_is_not_retried_twice(monkeypatch, unavailable_server, method, max_retries, expected_requests):
+    """Test that a 503 server sees one layer of retries, not the adapter's multiplied by tenacity's"""
+    monkeypatch.setattr(RequestsManager, '_session_cache', OrderedDict())
+    handler, url = unavailable_server
+    session = RequestsManager.create_session(max_retries=max_retries)
+
+    with pytest.raises((requests.exceptions.HTTPError, tenacity.RetryError)):
+        RequestsManager.make_request(
+            session=session,
+            url=url,
+            headers=_JSON_HEADERS,
+            json_data={"test": "data"},
+            timeout=5,
+            method=method,
+            wait=tenacity.wait_none(),
+            stop=tenacity.stop_after_attempt(3),
+        )
+    session.close()
+
+    assert handler.request_count == expected_requests
+
+def test_request_convenience_method(mocker):
+    """Test the convenience request method that gets a pooled session and makes a request"""
     # Mock make_request to avoid actual HTTP calls
-    with patch.object(RequestsManager, 'make_request') as mock_make_request, \
-         patch.object(RequestsManager, 'create_session') as mock_create_session:
-        
-        # Set up mocks
-        mock_session = MagicMock()
-        mock_create_session.return_value = mock_session
-        mock_make_request.return_value = {"success": True}
-        
-        # Call the convenience method
-        result = RequestsManager.request(
+    mock_make_request = mocker.patch.object(RequestsManager, 'make_request')
+    mock_get_session = mocker.patch.object(RequestsManager, '_get_or_create_session')
+
+    # Set up mocks
+    mock_session = MagicMock()
+    mock_get_session.return_value = mock_session
+    mock_make_request.return_value = {"success": True}
+    
+    # Call the convenience method
+    result = RequestsManager.request(
+        url="https://test.com/api",
+        headers=_JSON_HEADERS,
+        json_data={"test": "data"},
+        timeout=30,
+        method="POST",
+        stream=False,
+        max_retries=5,
+        wait=tenacity.wait_fixed(1), # Pass wait parameter
+        stop=tenacity.stop_after_attempt(4) # Pass stop parameter
+    )
+    
+    # Verify the pooled session was requested
+    mock_get_session.assert_called_once_with(
+        max_retries=5, auth=None, bearer_token=None, verify_ssl=True
+    )
+    
+    # Verify result was returned
+    assert result == {"success": True}
+    
+    # Verify make_request was called with the right params, including retry parameters
+    # Compare types and parameters, not object identity for tenacity objects
+    mock_make_request.assert_called_once() # Verify it was called once
+    call_args, call_kwargs = mock_make_request.call_args
+    assert call_kwargs['session'] == mock_session
+    assert call_kwargs['url'] == "https://test.com/api"
+    assert call_kwargs['headers'] == _JSON_HEADERS
+    assert call_kwargs['json_data'] == {"test": "data"}
+    assert call_kwargs['timeout'] == 30
+    assert call_kwargs['method'] == "POST"
+    assert call_kwargs['stream'] == False
+    
+    assert 'wait' in call_kwargs
+    assert 'stop' in call_kwargs
+    assert isinstance(call_kwargs['wait'], tenacity.wait.wait_base)
+    assert call_kwargs['wait'].__dict__ == tenacity.wait_fixed(1).__dict__
+    assert isinstance(call_kwargs['stop'], tenacity.stop.stop_base)
+    assert call_kwargs['stop'].__dict__ == tenacity.stop_after_attempt(4).__dict__
+
+def test_request_reuses_pooled_session(monkeypatch, mocker):
+    """Test that request() reuses the same Session for identical credentials"""
+    monkeypatch.setattr(RequestsManager, '_session_cache', OrderedDict())
+    mock_make_request = mocker.patch.object(RequestsManager, 'make_request')
+    for _ in range(2):
+        RequestsManager.request(
             url="https://test.com/api",
-            headers={"Content-Type": "application/json"},
-            json_data={"test": "data"},
-            timeout=30,
-            method="POST",
-            stream=False,
-            max_retries=5,
-            wait=tenacity.wait_fixed(1), # Pass wait parameter
-            stop=tenacity.stop_after_attempt(4) # Pass stop parameter
+            headers={},
+            json_data={},
+            bearer_token="token",
         )
-        
-        # Verify session was created
-        mock_create_session.assert_called_once_with(
-            max_retries=5, auth=None, bearer_token=None, verify_ssl=True
+    RequestsManager.request(
+        url="https://test.com/api",
+        headers={},
+        json_data={},
+        bearer_token="other-token",
+    )
+
+    sessions = [call.kwargs['session'] for call in mock_make_request.call_args_list]
+    assert sessions[0] is sessions[1]
+    assert sessions[2] is not sessions[0]
+    assert len(RequestsManager._session_cache) == 2
+    for session in RequestsManager._session_cache.values():
+        session.close()
+
+
+def test_session_cache_evicts_and_closes_least_recently_used(monkeypatch, mocker):
+    """Test that the session cache is bounded and closes the least recently used session it evicts"""
+    monkeypatch.setattr(RequestsManager, '_session_cache', OrderedDict())
+    monkeypatch.setattr(RequestsManager, '_SESSION_CACHE_MAXSIZE', 2)
+    first = RequestsManager.create_session(bearer_token="first")
+    second = RequestsManager.create_session(bearer_token="second")
+    # Touching the first session makes the second one the least recently used
+    assert RequestsManager.create_session(bearer_token="first") is first
+    close_second = mocker.spy(second, 'close')
+
+    third = RequestsManager.create_session(bearer_token="third")
+
+    close_second.assert_called_once_with()
+    assert list(RequestsManager._session_cache.values()) == [first, third]
+    assert RequestsManager.create_session(bearer_token="second") is not second
+    for session in RequestsManager._session_cache.values():
+        session.close()
+
+
+@pytest_asyncio.fixture
+async def async_transport(monkeypatch):
+    """Factory making RequestsManager build httpx.MockTransport-backed AsyncClients for the given handler."""
+    monkeypatch.setattr(RequestsManager, "_async_clients", {})
+
+    def install(handler):
+        monkeypatch.setattr(
+            RequestsManager,
+            "_build_async_client",
+            lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)),
         )
-        
-        # Verify result was returned
-        assert result == {"success": True}
-        
-        # Verify make_request was called with the right params, including retry parameters
-        # Compare types and parameters, not object identity for tenacity objects
-        mock_make_request.assert_called_once() # Verify it was called once
-        call_args, call_kwargs = mock_make_request.call_args
-        assert call_kwargs['session'] == mock_session
-        assert call_kwargs['url'] == "https://test.com/api"
-        assert call_kwargs['headers'] == {"Content-Type": "application/json"}
-        assert call_kwargs['json_data'] == {"test": "data"}
-        assert call_kwargs['timeout'] == 30
-        assert call_kwargs['method'] == "POST"
-        assert call_kwargs['stream'] == False
-        
-        assert 'wait' in call_kwargs
-        assert 'stop' in call_kwargs
-        assert isinstance(call_kwargs['wait'], wait_base)
-        assert call_kwargs['wait'].__dict__ == tenacity.wait_fixed(1).__dict__
-        assert isinstance(call_kwargs['stop'], stop_base)
-        assert call_kwargs['stop'].__dict__ == tenacity.stop_after_attempt(4).__dict__
+
+    yield install
+    await RequestsManager.aclose()
+
+
+def _run_in_new_loops(coroutine_function, count):
+    """Runs coroutine_function() under `count` successive asyncio.run() calls, returning the results.
+
+    asyncio.run() runs in a separate thread so the session event loop of pytest-asyncio is untouched.
+    """
+    results = []
+    for _ in range(count):
+        worker = threading.Thread(target=lambda: results.append(asyncio.run(coroutine_function())))
+        worker.start()
+        worker.join()
+    return results
+
+
+def test_async_client_is_bound_to_its_event_loop(monkeypatch):
+    """Test that each event loop gets its own AsyncClient, reused within the loop and closed by aclose()"""
+    monkeypatch.setattr(RequestsManager, "_async_clients", {})
+
+    async def _use_client():
+        client = await RequestsManager._get_async_client()
+        assert await RequestsManager._get_async_client() is client
+        await RequestsManager.aclose()
+        assert RequestsManager._async_clients == {}
+        return client
+
+    first, second = _run_in_new_loops(_use_client, 2)
+
+    assert first is not second
+    assert first.is_closed and second.is_closed
+
+
+def test_async_clients_released_when_loops_shut_down(monkeypatch, ok_server):
+    """Test that clients which pooled real connections are closed and dropped when asyncio.run() ends, without aclose()"""
+    monkeypatch.setattr(RequestsManager, "_async_clients", {})
+    handler, url = ok_server
+
+    async def _request():
+        response = await RequestsManager.amake_request(url=url, headers=_JSON_HEADERS, json_data={})
+        return response.status_code, await RequestsManager._get_async_client()
+
+    results = _run_in_new_loops(_request, 3)
+
+    assert [status for status, _ in results] == [200] * 3
+    assert handler.request_count == 3
+    assert len({id(client) for _, client in results}) == 3
+    assert all(client.is_closed for _, client in results)
+    assert RequestsManager._async_clients == {}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method", ["GET", "POST"])
+async def test_amake_request_success(async_transport, method):
+    """Test successful async request: GET sends query params, POST sends a JSON body"""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"success": True, "data": "test_data"})
+
+    async_transport(handler)
+    result = await RequestsManager.amake_request(
+        url="https://test.com/api",
+        headers=_JSON_HEADERS,
+        json_data={"test": "data"},
+        timeout=10,
+        method=method,
+    )
+
+    assert isinstance(result, httpx.Response)
+    assert result.json() == {"success": True, "data": "test_data"}
+    assert len(seen) == 1
+    request = seen[0]
+    assert request.method == method
+    assert request.headers["Content-Type"] == "application/json"
+    if method == "GET":
+        assert request.url == "https://test.com/api?test=data"
+    else:
+        assert request.url == "https://test.com/api"
+        assert json.loads(request.content) == {"test": "data"}
+
+
+@pytest.mark.asyncio
+async def test_amake_request_streaming(async_transport):
+    """Test async streaming request returns an unread response iterated by the caller"""
+    async_transport(lambda request: httpx.Response(200, content=_STREAM_BODY))
+
+    response = await RequestsManager.amake_request(
+        url="https://test.com/api/stream",
+        headers=_JSON_HEADERS,
+        json_data={"test": "data"},
+        method="POST",
+        stream=True,
+    )
+    try:
+        lines = [line async for line in response.aiter_lines()]
+    finally:
+        await response.aclose()
+
+    assert [line.encode("utf-8") for line in lines] == list(_STREAM_LINES)
+
+
+@pytest.mark.asyncio
+async def test_amake_request_retry_logic(async_transport):
+    """Test that async requests are retried on HTTP errors and succeed on the third attempt"""
+    statuses = iter([503, 502, 200])
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(next(statuses), json={"success": True})
+
+    async_transport(handler)
+    result = await RequestsManager.amake_request(
+        url="https://test.com/api",
+        headers=_JSON_HEADERS,
+        json_data={"test": "data"},
+        method="POST",
+        wait=tenacity.wait_none(),
+        stop=tenacity.stop_after_attempt(3),
+    )
+
+    assert result.json() == {"success": True}
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_amake_request_retry_exhausted(async_transport):
+    """Test that exhausted async retries raise RetryError chained to the HTTP error"""
+    async_transport(lambda request: httpx.Response(500, text="Internal Server Error"))
+
+    with pytest.raises(tenacity.RetryError) as excinfo:
+        await RequestsManager.amake_request(
+            url="https://test.com/api",
+            headers=_JSON_HEADERS,
+            json_data={},
+            wait=tenacity.wait_none(),
+            stop=tenacity.stop_after_attempt(2),
+        )
+    assert isinstance(excinfo.value.last_attempt.exception(), httpx.HTTPStatusError)
+
+
+@pytest.mark.asyncio
+async def test_amake_request_invalid_method(async_transport):
+    """Test that invalid methods are rejected before the shared client is used"""
+    async_transport(lambda request: pytest.fail("No request should be sent"))
+
+    with pytest.raises(ValueError, match="Unsupported HTTP method: PATCH"):
+        await RequestsManager.amake_request(
+            url="https://test.com/api", headers=_JSON_HEADERS, json_data={}, method="PATCH"
+        )
+
+
+def test_iter_sse_json_skips_non_data_and_invalid_lines(caplog):
+    """Test that iter_sse_json ignores keep-alives, comments, [DONE] and invalid JSON payloads"""
+    response = requests.Response()
+    response.raw = io.BytesIO(b"\n".join([
+        b": keep-alive",
+        b"",
+        b'data: {"id": 1}',
+        b"data: not-json",
+        b"event: ping",
+        b"data:",
+        b"data: [DONE]",
+    ]))
+
+    assert list(RequestsManager.iter_sse_json(response)) == [{"id": 1}]
+    assert "Error decoding JSON stream chunk" in caplog.text
@@ -5,6 +5,24 @@ from unittest.mock import patch, MagicMock
 from fbpyutils_ai.tools.llm.utils import get_api_model_response
 from fbpyutils_ai.tools.http import RequestsManager
 
+MODELS_URL = "http://example.com/api/models"
+ANTHROPIC_MODELS_URL = "https://api.anthropic.com/v1/models"
+API_KEY = "fake_api_key"
+ANTHROPIC_API_KEY = "fake_anthropic_key"
+
+# Headers get_api_model_response is expected to send, built once for every test
+EXPECTED_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/109.0.0.0 Safari/537.36", # Use the correct default User-Agent
+    "Content-Type": "application/json",
+    "Authorization": f"Bearer {API_KEY}",
+}
+EXPECTED_ANTHROPIC_HEADERS = {
+    **EXPECTED_HEADERS,
+    "Authorization": f"Bearer {ANTHROPIC_API_KEY}", # Ensure Authorization is still present
+    "x-api-key": ANTHROPIC_API_KEY,
+    "anthropic-version": "2023-06-01",
+}
+
 @patch('fbpyutils_ai.tools.http.RequestsManager.make_request')
 @patch('fbpyutils_ai.tools.http.RequestsManager.create_session')
 def test_get_api_model_response_success(mock_create_session, mock_make_request):
@@ -16,20 +34,13 @@ def test_get_api_model_response_success(mock_create_session, mock_make_request):
     mock_response.json.return_value = {"models": ["model1", "model2"]}
     mock_make_request.return_value = mock_response
 
-    url = "http://example.com/api/models"
-    api_key = "fake_api_key"
-
-    response = get_api_model_response(url, api_key)
+    response = get_api_model_response(MODELS_URL, API_KEY)
 
     mock_create_session.assert_called_once()
     mock_make_request.assert_called_once_with(
         session=mock_create_session.return_value,
-        url=url,
-        headers={
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/109.0.0.0 Safari/537.36", # Use the correct default User-Agent
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {api_key}",
-        },
+        url=MODELS_URL,
+        headers=EXPECTED_HEADERS,
         json_data={},
         timeout=300,
         method="GET",
@@ -48,16 +59,10 @@ def test_get_api_model_response_anthropic_headers(mock_create_session, mock_make
     mock_response.status_code = 200
     mock_make_request.return_value = mock_response
 
-    url = "https://api.anthropic.com/v1/models"
-    api_key = "fake_anthropic_key"
-
-    get_api_model_response(url, api_key)
+    get_api_model_response(ANTHROPIC_MODELS_URL, ANTHROPIC_API_KEY)
 
     mock_make_request.assert_called_once()
-    called_headers = mock_make_request.call_args[1]['headers']
-    assert called_headers["x-api-key"] == api_key
-    assert called_headers["anthropic-version"] == "2023-06-01"
-    assert called_headers["Authorization"] == f"Bearer {api_key}" # Ensure Authorization is still present
+    assert mock_make_request.call_args[1]['headers'] == EXPECTED_ANTHROPIC_HEADERS
 
 @patch('fbpyutils_ai.tools.http.RequestsManager.make_request')
 @patch('fbpyutils_ai.tools.http.RequestsManager.create_session')
@@ -69,11 +74,9 @@ def test_get_api_model_response_custom_timeout(mock_create_session, mock_make_re
     mock_response.status_code = 200
     mock_make_request.return_value = mock_response
 
-    url = "http://example.com/api/models"
-    api_key = "fake_api_key"
     custom_timeout = 60
 
-    get_api_model_response(url, api_key, timeout=custom_timeout)
+    get_api_model_response(MODELS_URL, API_KEY, timeout=custom_timeout)
 
     mock_make_request.assert_called_once()
     called_timeout = mock_make_request.call_args[1]['timeout']
@@ -86,11 +89,8 @@ def test_get_api_model_response_exception_handling(mock_log_error, mock_create_s
     """
     Test exception handling and logging.
     """
-    url = "http://example.com/api/models"
-    api_key = "fake_api_key"
-
     with pytest.raises(requests.exceptions.RequestException):
-        get_api_model_response(url, api_key)
+        get_api_model_response(MODELS_URL, API_KEY)
 
     mock_create_session.assert_called_once()
     mock_make_request.assert_called_once()
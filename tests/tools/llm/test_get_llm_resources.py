@@ -1,19 +1,22 @@
-import pytest
 import json
-from unittest.mock import patch, mock_open
+import os
+
+import pytest
 
+from fbpyutils_ai.tools.llm import utils
 from fbpyutils_ai.tools.llm.utils import get_llm_resources
 
 # Mock content for the resource files
 MOCK_PROMPT_CONTENT = "This is a mock prompt."
-MOCK_SCHEMA_CONTENT = json.dumps({
+MOCK_SCHEMA = {
     "type": "object",
     "properties": {
         "name": {"type": "string"},
         "version": {"type": "string"}
     },
     "required": ["name"]
-})
+}
+MOCK_SCHEMA_CONTENT = json.dumps(MOCK_SCHEMA)
 MOCK_PROVIDERS_CONTENT = """
 | Provider | Model ID | API Base URL | Env API Key | Selected |
 |---|---|---|---|---|
@@ -22,100 +25,112 @@ MOCK_PROVIDERS_CONTENT = """
 | google | gemini-pro | https://generativelanguage.googleapis.com/v1 | GOOGLE_API_KEY | True |
 """
 
-@patch('builtins.open', new_callable=mock_open)
-@patch('json.load')
-@patch('os.path.join')
-def test_get_llm_resources_success(mock_os_path_join, mock_json_load, mock_builtin_open):
-    """
-    Test successful retrieval and parsing of LLM resources.
-    """
-    # Configure mock_os_path_join to return predictable paths using forward slashes
-    mock_os_path_join.side_effect = lambda *args: "/".join(args)
 
-    # Configure mock_builtin_open to return different content based on the path
-    def mock_open_side_effect(file_path, *args, **kwargs):
-        if "llm_introspection_prompt.md" in file_path:
-            return mock_open(read_data=MOCK_PROMPT_CONTENT).return_value
-        elif "llm_introspection_validation_schema.json" in file_path:
-            return mock_open(read_data=MOCK_SCHEMA_CONTENT).return_value
-        elif "llm_providers.md" in file_path:
-            return mock_open(read_data=MOCK_PROVIDERS_CONTENT).return_value
-        else:
-            # Fallback for unexpected file access
-            return mock_open().return_value
+@pytest.fixture(autouse=True)
+def _clear_llm_resources_cache():
+    """Drops the cached resources so each test reads its own files, and the real ones are reloaded afterwards."""
+    get_llm_resources.cache_clear()
+    yield
+    get_llm_resources.cache_clear()
 
-    mock_builtin_open.side_effect = mock_open_side_effect
 
-    # Configure mock_json_load for the schema file
-    mock_json_load.return_value = json.loads(MOCK_SCHEMA_CONTENT)
+@pytest.fixture
+def resources_dir(tmp_path, monkeypatch):
+    """
+    Writes the mock resource files to a temporary folder and points get_llm_resources at them.
 
-    llm_providers, llm_common_params, llm_introspection_prompt, llm_introspection_validation_schema = get_llm_resources()
+    get_llm_resources reads real files, so tests replace or remove individual files
+    instead of patching open().
+    """
+    for attr, file_name, content in (
+        ("_PROMPT_PATH", "llm_introspection_prompt.md", MOCK_PROMPT_CONTENT),
+        ("_SCHEMA_PATH", "llm_introspection_validation_schema.json", MOCK_SCHEMA_CONTENT),
+        ("_PROVIDERS_PATH", "llm_providers.md", MOCK_PROVIDERS_CONTENT),
+    ):
+        resource_file = tmp_path / file_name
+        resource_file.write_text(content, encoding="utf-8")
+        monkeypatch.setattr(utils, attr, str(resource_file))
+    return tmp_path
+
+
+MOCK_EMPTY_PROVIDERS_CONTENT = """
+| Provider | Model ID | API Base URL | Env API Key | Selected |
+|---|---|---|---|---|
+"""
 
-    # Assert that open was called for each resource file
-    mock_builtin_open.assert_any_call("fbpyutils_ai/tools/llm/resources/llm_introspection_prompt.md", "r", encoding="utf-8")
-    mock_builtin_open.assert_any_call("fbpyutils_ai/tools/llm/resources/llm_introspection_validation_schema.json", "r", encoding="utf-8")
-    mock_builtin_open.assert_any_call("fbpyutils_ai/tools/llm/resources/llm_providers.md", "r", encoding="utf-8")
+EXPECTED_PROVIDERS = {
+    "openai": {"provider": "openai", "model_id": "gpt-4", "api_base_url": "https://api.openai.com/v1", "env_api_key": "OPENAI_API_KEY", "selected": "True"},
+    "google": {"provider": "google", "model_id": "gemini-pro", "api_base_url": "https://generativelanguage.googleapis.com/v1", "env_api_key": "GOOGLE_API_KEY", "selected": "True"},
+}
+
+EXPECTED_COMMON_PARAMS = [
+    "temperature",
+    "max_tokens",
+    "top_p",
+    "stream",
+    "stream_options",
+    "tool_choice",
+]
+
+
+@pytest.mark.parametrize(
+    "providers_content, expected_providers",
+    [
+        pytest.param(MOCK_PROVIDERS_CONTENT, EXPECTED_PROVIDERS, id="selected_providers"),
+        # Empty providers table: expect an empty dictionary
+        pytest.param(MOCK_EMPTY_PROVIDERS_CONTENT, {}, id="empty_providers"),
+    ],
+)
+def test_get_llm_resources(resources_dir, providers_content, expected_providers):
+    """
+    Test retrieval and parsing of LLM resources, with and without selected providers.
+    """
+    (resources_dir / "llm_providers.md").write_text(providers_content, encoding="utf-8")
+
+    resources = get_llm_resources()
+    llm_providers, llm_common_params, llm_introspection_prompt, llm_introspection_validation_schema = resources
+
+    # Later calls are served from the cache, even once the files are gone
+    for resource_file in resources_dir.iterdir():
+        resource_file.unlink()
+    assert get_llm_resources() is resources
 
     # Assert the returned values are correct
-    expected_providers = {
-        "openai": {"provider": "openai", "model_id": "gpt-4", "api_base_url": "https://api.openai.com/v1", "env_api_key": "OPENAI_API_KEY", "selected": "True"},
-        "google": {"provider": "google", "model_id": "gemini-pro", "api_base_url": "https://generativelanguage.googleapis.com/v1", "env_api_key": "GOOGLE_API_KEY", "selected": "True"},
-    }
     assert llm_providers == expected_providers
-
-    expected_common_params = [
-        "temperature",
-        "max_tokens",
-        "top_p",
-        "stream",
-        "stream_options",
-        "tool_choice",
-    ]
-    assert llm_common_params == expected_common_params
+    assert llm_common_params == EXPECTED_COMMON_PARAMS
     assert llm_introspection_prompt == MOCK_PROMPT_CONTENT
-    assert llm_introspection_validation_schema == json.loads(MOCK_SCHEMA_CONTENT)
-
-@patch('builtins.open', new_callable=mock_open)
-@patch('json.load')
-@patch('os.path.join')
-def test_get_llm_resources_empty_providers(mock_os_path_join, mock_json_load, mock_builtin_open):
+    assert llm_introspection_validation_schema == MOCK_SCHEMA
+
+
+@pytest.mark.parametrize(
+    "file_name, content, expected_error",
+    [
+        pytest.param("llm_introspection_validation_schema.json", None, FileNotFoundError, id="schema_not_found"),
+        pytest.param("llm_introspection_validation_schema.json", "{invalid json", json.JSONDecodeError, id="schema_decode_error"),
+        pytest.param("llm_introspection_prompt.md", None, FileNotFoundError, id="prompt_not_found"),
+    ],
+)
+def test_get_llm_resources_invalid_files(resources_dir, file_name, content, expected_error):
     """
-    Test retrieval when the providers file is empty or has no selected providers.
+    Test that missing or malformed resource files raise, and that failures are not cached.
     """
-    # Configure mock_os_path_join to return predictable paths using forward slashes
-    mock_os_path_join.side_effect = lambda *args: "/".join(args)
+    resource_file = resources_dir / file_name
+    if content is None:
+        resource_file.unlink()
+    else:
+        resource_file.write_text(content, encoding="utf-8")
 
-    # Configure mock_builtin_open to return different content based on the path
+    with pytest.raises(expected_error):
+        get_llm_resources()
+    assert get_llm_resources.cache_info().currsize == 0
 
-    MOCK_EMPTY_PROVIDERS_CONTENT = """
-| Provider | Model ID | API Base URL | Env API Key | Selected |
-|---|---|---|---|---|
-"""
 
-    def mock_open_side_effect(file_path, *args, **kwargs):
-        if "llm_introspection_prompt.md" in file_path:
-            return mock_open(read_data=MOCK_PROMPT_CONTENT).return_value
-        elif "llm_introspection_validation_schema.json" in file_path:
-            return mock_open(read_data=MOCK_SCHEMA_CONTENT).return_value
-        elif "llm_providers.md" in file_path:
-            return mock_open(read_data=MOCK_EMPTY_PROVIDERS_CONTENT).return_value
-        else:
-            return mock_open().return_value
-
-    mock_builtin_open.side_effect = mock_open_side_effect
-    mock_json_load.return_value = json.loads(MOCK_SCHEMA_CONTENT)
-
-    llm_providers, llm_common_params, llm_introspection_prompt, llm_introspection_validation_schema = get_llm_resources()
-
-    assert llm_providers == {} # Expect empty dictionary
-    expected_common_params = [
-        "temperature",
-        "max_tokens",
-        "top_p",
-        "stream",
-        "stream_options",
-        "tool_choice",
-    ]
-    assert llm_common_params == expected_common_params
-    assert llm_introspection_prompt == MOCK_PROMPT_CONTENT
-    assert llm_introspection_validation_schema == json.loads(MOCK_SCHEMA_CONTENT)
+def test_resource_paths_do_not_depend_on_working_directory(tmp_path, monkeypatch):
+    """
+    Test that the packaged resource files are found from any working directory.
+    """
+    monkeypatch.chdir(tmp_path)
+
+    for path in (utils._PROMPT_PATH, utils._SCHEMA_PATH, utils._PROVIDERS_PATH):
+        assert os.path.isabs(path)
+        assert os.path.isfile(path)
@@ -0,0 +1,226 @@
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from fbpyutils_ai.tools import LLMServiceModel
+from fbpyutils_ai.tools.http import RequestsManager
+from fbpyutils_ai.tools.llm import OpenAILLMService, _introspection_backoff
+from tests.tools.adapters import ScriptedAdapter, json_response
+
+
+API_BASE_URL = "https://api.test.com/v1"
+
+
+@pytest.fixture
+def llm_service():
+    """OpenAILLMService with a single test model and three introspection attempts."""
+    model = LLMServiceModel(
+        provider="openai",
+        api_base_url=API_BASE_URL,
+        api_key="test_key",
+        model_id="test-model",
+    )
+    return OpenAILLMService(model, retries=3)
+
+
+def test_introspection_backoff_grows_exponentially_and_is_capped(mocker):
+    """Test that the introspection delay doubles per attempt and never exceeds the cap"""
+    mocker.patch("fbpyutils_ai.tools.llm.random.random", return_value=0.0)
+
+    assert [_introspection_backoff(n) for n in (1, 2, 3)] == [0.5, 1.0, 2.0]
+    assert _introspection_backoff(20) == 30.0
+
+
+def test_get_model_details_backs_off_between_introspection_attempts(mocker, llm_service):
+    """Test that failed introspection attempts are retried with backoff, without sleeping after the last one"""
+    response = MagicMock()
+    response.json.return_value = {"id": "test-model"}
+    mocker.patch("fbpyutils_ai.tools.llm.get_api_model_response", return_value=response)
+    mocker.patch("fbpyutils_ai.tools.llm.random.random", return_value=0.0)
+    mock_sleep = mocker.patch("fbpyutils_ai.tools.llm._sleep")
+    mock_completions = mocker.patch.object(
+        llm_service, "generate_completions", return_value="not a JSON document"
+    )
+
+    details = llm_service.get_model_details(introspection=True)
+
+    assert mock_completions.call_count == 3
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [0.5, 1.0]
+    report = details["introspection"]["report"]
+    assert report["generation_ok"] is False
+    assert report["decode_error"] is True
+    assert report["sanitized"] is True
+
+
+
+def test_get_model_details_retries_after_completion_error(mocker, llm_service):
+    """Test that an exception from the completion call is retried like an invalid reply"""
+    response = MagicMock()
+    response.json.return_value = {"id": "test-model"}
+    mocker.patch("fbpyutils_ai.tools.llm.get_api_model_response", return_value=response)
+    mocker.patch("fbpyutils_ai.tools.llm.LLM_INTROSPECTION_VALIDATOR")
+    mock_sleep = mocker.patch("fbpyutils_ai.tools.llm._sleep")
+    mock_completions = mocker.patch.object(
+        llm_service, "generate_completions", side_effect=[RuntimeError("boom"), '{"name": "test-model"}']
+    )
+
+    details = llm_service.get_model_details(introspection=True)
+
+    assert mock_completions.call_count == 2
+    mock_sleep.assert_called_once()
+    # The failed attempt is fed back to the model before the retry
+    retry_messages = mock_completions.call_args.kwargs["messages"]
+    assert "boom" in retry_messages[-1]["content"]
+    assert details["introspection"]["name"] == "test-model"
+    assert details["introspection"]["report"]["generation_ok"] is True
+
+LIST_MODELS_CASES = [
+    pytest.param(
+        {"object": "list", "data": [{"id": "model-a"}, {"id": "model-b"}]},
+        ["model-a", "model-b"],
+        id="openai_data_format",
+    ),
+    pytest.param([{"id": "model-a"}, {"id": "model-c"}], ["model-a", "model-c"], id="direct_list_format"),
+    pytest.param({"object": "list", "data": []}, [], id="empty_data"),
+    pytest.param([], [], id="empty_list"),
+]
+
+
+@pytest.fixture
+def models_api(monkeypatch):
+    """ScriptedAdapter answering API_BASE_URL on a fresh session handed out by RequestsManager.create_session."""
+    session = requests.Session()
+    adapter = ScriptedAdapter()
+    session.mount(API_BASE_URL, adapter)
+    monkeypatch.setattr(RequestsManager, "create_session", lambda *args, **kwargs: session)
+    yield adapter
+    session.close()
+
+
+@pytest.mark.parametrize("payload, expected_ids", LIST_MODELS_CASES)
+def test_list_models_shapes(models_api, payload, expected_ids):
+    """Test that list_models flattens each supported payload shape into a list of model dicts"""
+    models_api.outcomes.append(json_response(payload))
+
+    models = OpenAILLMService.list_models(API_BASE_URL, "test_key", timeout=10)
+
+    assert [model["id"] for model in models] == expected_ids
+    (request,) = models_api.requests
+    assert request.method == "GET"
+    assert request.url == f"{API_BASE_URL}/models"
+    assert request.headers["Authorization"] == "Bearer test_key"
+
+
+@pytest.mark.parametrize("api_base_url, api_key", [("", "test_key"), (API_BASE_URL, None)])
+def test_list_models_requires_base_url_and_key(models_api, api_base_url, api_key):
+    """Test that list_models rejects a missing base URL or API key before any request is made"""
+    with pytest.raises(ValueError):
+        OpenAILLMService.list_models(api_base_url, api_key)
+    assert models_api.requests == []
+
+
+@pytest.mark.parametrize(
+    "reply, expected_notes",
+    [
+        # Backticks inside a plain JSON reply are left untouched
+        pytest.param('{"name": "test-model", "notes": "use ``` fences"}', "use ``` fences", id="plain_json"),
+        pytest.param('```json\n{"name": "test-model", "notes": "none"}\n```', "none", id="fenced_json"),
+    ],
+)
+def test_get_model_details_parses_plain_and_fenced_json(mocker, llm_service, reply, expected_notes):
+    """Test that plain JSON replies are parsed as-is and fenced replies are parsed after stripping the fences"""
+    response = MagicMock()
+    response.json.return_value = {"id": "test-model"}
+    mocker.patch("fbpyutils_ai.tools.llm.get_api_model_response", return_value=response)
+    mock_validator = mocker.patch("fbpyutils_ai.tools.llm.LLM_INTROSPECTION_VALIDATOR")
+    mock_completions = mocker.patch.object(llm_service, "generate_completions", return_value=reply)
+
+    details = llm_service.get_model_details(introspection=True)
+
+    mock_completions.assert_called_once()
+    parsed = mock_validator.validate.call_args.args[0]
+    assert (parsed["name"], parsed["notes"]) == ("test-model", expected_notes)
+    assert details["introspection"]["report"]["generation_ok"] is True
+    assert details["introspection"]["report"]["sanitized"] is False
+
+
+EMBED_API_BASE_URL = "https://embed.test.com/v1"
+
+
+@pytest.fixture
+def llm_service_with_embed_model():
+    """OpenAILLMService whose embed model lives on a separate endpoint; vision falls back to base."""
+    base_model = LLMServiceModel(
+        provider="openai", api_base_url=API_BASE_URL, api_key="test_key", model_id="test-model"
+    )
+    embed_model = LLMServiceModel(
+        provider="openai", api_base_url=EMBED_API_BASE_URL, api_key="embed_key", model_id="embed-model"
+    )
+    return OpenAILLMService(base_model, embed_model=embed_model)
+
+
+def test_list_models_batch_all(mocker, llm_service_with_embed_model):
+    """Test that list_models_batch queries each distinct endpoint once and maps results to every model type"""
+    models_by_url = {API_BASE_URL: [{"id": "test-model"}], EMBED_API_BASE_URL: [{"id": "embed-model"}]}
+    mock_list_models = mocker.patch.object(
+        OpenAILLMService, "list_models", side_effect=lambda url, key, **kwargs: models_by_url[url]
+    )
+
+    models = llm_service_with_embed_model.list_models_batch(timeout=10)
+
+    assert models == {
+        "base": [{"id": "test-model"}],
+        "embed": [{"id": "embed-model"}],
+        "vision": [{"id": "test-model"}],
+    }
+    assert sorted(call.args for call in mock_list_models.call_args_list) == [
+        (API_BASE_URL, "test_key"),
+        (EMBED_API_BASE_URL, "embed_key"),
+    ]
+    assert all(call.kwargs == {"timeout": 10} for call in mock_list_models.call_args_list)
+
+
+def test_list_models_batch_partial_failure(mocker, llm_service_with_embed_model):
+    """Test that a failing endpoint makes list_models_batch raise instead of returning partial results"""
+    def list_models(url, key, **kwargs):
+        if url == EMBED_API_BASE_URL:
+            raise requests.exceptions.ConnectionError("embed endpoint down")
+        return [{"id": "test-model"}]
+
+    mocker.patch.object(OpenAILLMService, "list_models", side_effect=list_models)
+
+    with pytest.raises(requests.exceptions.ConnectionError, match="embed endpoint down"):
+        llm_service_with_embed_model.list_models_batch(("base", "embed"))
+
+
+@pytest.fixture
+def mock_embeddings_request(mocker, llm_service):
+    """Patches _make_request to answer with two embeddings, listed out of input order."""
+    response = MagicMock()
+    response.json.return_value = {
+        "data": [
+            {"index": 1, "embedding": [0.3, 0.4]},
+            {"index": 0, "embedding": [0.1, 0.2]},
+        ]
+    }
+    return mocker.patch.object(llm_service, "_make_request", return_value=response)
+
+
+def test_generate_embeddings_single_text(mock_embeddings_request, llm_service):
+    """Test that a single text returns a single embedding vector"""
+    embedding = llm_service.generate_embeddings("hello")
+
+    assert embedding == [0.1, 0.2]
+    assert mock_embeddings_request.call_args.args[2] == {"model": "test-model", "input": "hello"}
+
+
+def test_generate_embeddings_batch(mock_embeddings_request, llm_service):
+    """Test that a list of texts is embedded with one request and returns one vector per text, in order"""
+    embeddings = llm_service.generate_embeddings(["hello", "world"])
+
+    assert embeddings == [[0.1, 0.2], [0.3, 0.4]]
+    mock_embeddings_request.assert_called_once()
+    url, _, data = mock_embeddings_request.call_args.args
+    assert url == f"{API_BASE_URL}/embeddings"
+    assert data == {"model": "test-model", "input": ["hello", "world"]}
@@ -0,0 +1,71 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+# The vector database backends are optional dependencies of the embedding module
+embedding = pytest.importorskip("fbpyutils_ai.tools.embedding")
+EmbeddingManager = embedding.EmbeddingManager
+
+
+def _fake_embeddings(texts):
+    """Returns one single-value vector per text, holding the text length."""
+    return [[float(len(text))] for text in texts]
+
+
+@pytest.fixture
+def manager():
+    """EmbeddingManager over mocked LLM service and vector database."""
+    llm_service = MagicMock()
+    llm_service.generate_embeddings.side_effect = _fake_embeddings
+    return EmbeddingManager(llm_service, MagicMock())
+
+
+@pytest.mark.parametrize("parallel", [True, False])
+def test_add_documents_embeds_in_bounded_batches(manager, parallel):
+    """Test that add_documents embeds at most batch_size texts per request and stores every document once"""
+    documents = [("x" * n, f"doc-{n}", {"n": n}) for n in range(1, 6)]
+
+    manager.add_documents(documents, parallel=parallel, batch_size=2)
+
+    batches = [call.args[0] for call in manager.llm_service.generate_embeddings.call_args_list]
+    assert sorted(len(batch) for batch in batches) == [1, 2, 2]
+    ids, vectors, metadatas = manager.vector_database.add_embeddings.call_args.args
+    assert ids == [f"doc-{n}" for n in range(1, 6)]
+    assert vectors == [[float(n)] for n in range(1, 6)]
+    assert metadatas == [{"n": n} for n in range(1, 6)]
+
+
+def test_add_documents_skips_failed_batch_with_error_log(manager, mocker):
+    """Test that a batch whose embeddings are None is logged and skipped while the others are stored"""
+    manager.llm_service.generate_embeddings.side_effect = [None, [[1.0]]]
+    mock_error = mocker.patch.object(embedding.logging, "error")
+
+    manager.add_documents([("a", "doc-a", None), ("b", None, None)], parallel=False, batch_size=1)
+
+    mock_error.assert_called_once()
+    ids, vectors, metadatas = manager.vector_database.add_embeddings.call_args.args
+    assert ids == [manager.generate_id_from_text("b")]
+    assert (vectors, metadatas) == ([[1.0]], [{}])
+
+
+def test_add_documents_skips_batch_with_missing_embeddings(manager, mocker):
+    """Test that a batch answered with fewer vectors than texts is logged and skipped as a whole"""
+    manager.llm_service.generate_embeddings.side_effect = [[[1.0]], [[3.0]]]
+    mock_error = mocker.patch.object(embedding.logging, "error")
+
+    manager.add_documents(
+        [("a", "doc-a", None), ("bb", "doc-b", None), ("ccc", "doc-c", None)],
+        parallel=False,
+        batch_size=2,
+    )
+
+    mock_error.assert_called_once()
+    ids, vectors, metadatas = manager.vector_database.add_embeddings.call_args.args
+    assert (ids, vectors, metadatas) == (["doc-c"], [[3.0]], [{}])
+
+
+def test_add_documents_rejects_non_positive_batch_size(manager):
+    """Test that add_documents refuses a batch_size that cannot make progress"""
+    with pytest.raises(ValueError, match="batch_size"):
+        manager.add_documents([("a", "doc-a", None)], batch_size=0)
+    manager.llm_service.generate_embeddings.assert_not_called()
@@ -59,8 +59,12 @@ def test_model_map_initialization(llm_service):
     assert isinstance(llm_service.model_map, dict) and len(llm_service.model_map) == 3
 
 def test_generate_embeddings(llm_service):
+    embedding = llm_service.generate_embeddings("Olá, mundo!")
+    assert all([isinstance(f, float) for f in embedding])
+
     embeddings = llm_service.generate_embeddings(["Olá, mundo!", "Ok, tchau!"])
-    assert all([isinstance(f, float) for f in embeddings])
+    assert len(embeddings) == 2
+    assert all([isinstance(f, float) for e in embeddings for f in e])
 
 def test_generate_text(llm_service):
     question = "Qual a raiz quadrada de 0.56?"